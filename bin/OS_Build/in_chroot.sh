@@ -73,6 +73,7 @@ apt-get install -y \
     python3-torch \
     python3-psutil \
     python3-pynvml \
+    python3-xlib \
     gir1.2-gtk-4.0 \
     libadwaita-1-0 \
     gir1.2-adw-1 \
@@ -9,10 +9,11 @@ the MAGI Shell interface panels.
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Adw
+from gi.repository import Adw, Gdk, GLib
 import signal
 import sys
 from .panel import MAGIPanel
+from ..utils.x11 import flush
 
 class MAGIApplication(Adw.Application):
     """
@@ -24,19 +25,37 @@ class MAGIApplication(Adw.Application):
     Attributes:
         top_panel: Top panel window instance
         bottom_panel: Bottom panel window instance
+        monitor_info (tuple): Primary monitor x, y, width, height and scale
+            factor, shared by both panels
     """
     
     def __init__(self):
         """Initialize the MAGI Shell application."""
         super().__init__(application_id='com.system.magi.shell')
+        self.monitor_info = None
         
     def do_activate(self):
         """Handle application activation."""
         try:
+            # Read the monitor once for both panels and follow its changes
+            self.monitor_info = self._snapshot_monitor()
+            monitors = Gdk.Display.get_default().get_monitors()
+            monitors.connect('items-changed', self._on_monitors_changed)
+            self._watch_monitors(monitors, 0, monitors.get_n_items())
+            
             # Create panels
             self.top_panel = MAGIPanel(self, position='top')
             self.bottom_panel = MAGIPanel(self, position='bottom')
             
+            # Realize both panels first so their window setup reaches the X
+            # server in one write, before either window is mapped
+            for panel in (self.top_panel, self.bottom_panel):
+                panel.realize()
+            # The setup goes out on our own Xlib connection; GDK's
+            # CreateWindow requests must reach the server before it does
+            Gdk.Display.get_default().sync()
+            flush()
+            
             # Show panels
             for panel in (self.top_panel, self.bottom_panel):
                 panel.present()
@@ -44,20 +63,55 @@ class MAGIApplication(Adw.Application):
         except Exception as e:
             print(f"Application activation error: {e}")
             sys.exit(1)
+    
+    def _snapshot_monitor(self):
+        """Read the primary monitor's geometry and scale factor."""
+        monitor = Gdk.Display.get_default().get_primary_monitor()
+        geometry = monitor.get_geometry()
+        return (geometry.x, geometry.y, geometry.width, geometry.height,
+                monitor.get_scale_factor())
+    
+    def _watch_monitors(self, monitors, position, count):
+        """Follow geometry and scale changes of the given monitors."""
+        for index in range(position, position + count):
+            monitor = monitors.get_item(index)
+            monitor.connect('notify::geometry', lambda *args: self._check_monitor())
+            monitor.connect('notify::scale-factor', lambda *args: self._check_monitor())
+    
+    def _on_monitors_changed(self, monitors, position, removed, added):
+        """Handle monitors being plugged in or removed."""
+        self._watch_monitors(monitors, position, added)
+        self._check_monitor()
+    
+    def _check_monitor(self):
+        """Refresh the monitor snapshot and reposition the panels if it moved."""
+        try:
+            monitor_info = self._snapshot_monitor()
+            if monitor_info != self.monitor_info:
+                self.monitor_info = monitor_info
+                for panel in (self.top_panel, self.bottom_panel):
+                    panel.queue_geometry_update()
+        except Exception as e:
+            print(f"Monitor check error: {e}")
+        return True
 
 def main():
     """Main entry point for the MAGI Shell application."""
     try:
         app = MAGIApplication()
         
-        def cleanup(signum=None, frame=None):
+        def cleanup():
             """Clean up resources on exit."""
             print("\nCleaning up...")
-            sys.exit(0)
         
-        # Set up signal handlers
-        signal.signal(signal.SIGINT, cleanup)
-        signal.signal(signal.SIGTERM, cleanup)
+        def on_signal():
+            """Leave the main loop so run() returns and cleanup runs."""
+            app.quit()
+            return GLib.SOURCE_REMOVE
+        
+        # Handle signals from the main loop rather than between bytecodes
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            GLib.unix_signal_add(GLib.PRIORITY_HIGH, signum, on_signal)
         
         # Run application
         exit_code = app.run(sys.argv)
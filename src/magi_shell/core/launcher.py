@@ -3,7 +3,8 @@
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, GLib, Adw, Gio, GObject, Gdk
+gi.require_version('GdkX11', '4.0')
+from gi.repository import Gtk, GLib, Adw, Gio, GObject, Gdk, GdkX11
 import os
 import subprocess
 import sys
@@ -21,6 +22,7 @@ except ImportError:
     import sys
     sys.path.append(str(Path(__file__).parent.parent.parent))
     from magi_shell.core.theme import ThemeManager
+from magi_shell.utils.x11 import move_window, activate_window, flush
 
 class MAGILauncher(Adw.ApplicationWindow):
     def __init__(self, app):
@@ -88,11 +90,11 @@ class MAGILauncher(Adw.ApplicationWindow):
 
     def move_and_show_window(self, x, y):
         try:
-            out = subprocess.check_output(['xdotool', 'search', '--name', '^MAGI Launcher$']).decode().strip()
-            if out:
-                window_id = out.split('\n')[0]
-                subprocess.run(['wmctrl', '-i', '-r', window_id, '-e', f'0,{x},{y},-1,-1'], check=True)
-                subprocess.run(['wmctrl', '-i', '-a', window_id], check=True)
+            # Our own X window, straight from GDK instead of an xdotool search
+            window_id = self.get_surface().get_xid()
+            move_window(window_id, x, y)
+            activate_window(window_id)
+            flush()
         except Exception as e:
             logger.error(f"Failed to position window: {e}")
         
@@ -13,24 +13,32 @@ print("Importing gi...")
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, GLib, Adw
+gi.require_version('GdkX11', '4.0')
+from gi.repository import Gtk, Gdk, GLib, Adw, GdkX11
 print("Imported gi successfully")
 
 print("Importing standard libraries...")
 import os
-import subprocess
+import signal
 import sys
-import time
+from datetime import datetime
 print("Imported standard libraries successfully")
 
 print("Importing MAGI utils...")
 try:
-    from magi_shell.utils.cache import Cache
-    print("Imported Cache")
-    from magi_shell.utils.update import UpdateManager
+    from magi_shell.utils.update import UpdateManager, Ticker
     print("Imported UpdateManager")
     from magi_shell.utils.config import load_config
     print("Imported load_config")
+    from magi_shell.utils.speech import speak
+    print("Imported speak")
+    from magi_shell.utils.process import spawn_async
+    print("Imported spawn_async")
+    from magi_shell.utils.x11 import (
+        RootWindowWatcher, set_window_type, add_window_states,
+        move_resize_window, set_strut_partial, flush
+    )
+    print("Imported X11 utilities")
 except Exception as e:
     print(f"Error importing utils: {e}")
     raise
@@ -54,6 +62,19 @@ except Exception as e:
     print(f"Error importing ThemeManager: {e}")
     raise
 
+# Helper programs started by the panel buttons, built once at import
+_HERE = os.path.dirname(__file__)
+LAUNCHER_ARGV = (sys.executable, os.path.join(_HERE, 'launcher.py'))
+SETTINGS_ARGV = (sys.executable, os.path.join(_HERE, '../../settings.py'))
+LLM_MENU_ARGV = (sys.executable, os.path.join(_HERE, '../../magi_shell/llm_menu.py'))
+
+# Output of the terminal assistant's ASR and assistant processes
+ASSISTANT_ASR_LOG_PATH = '/tmp/MAGI/desktop_asr.log'
+ASSISTANT_LOG_PATH = '/tmp/MAGI/desktop_assistant.log'
+
+# Context shared with the LLM menu, rewritten whenever focus or selection changes
+CONTEXT_PATH = '/tmp/MAGI/current_context.txt'
+
 print("Starting MAGIPanel class definition...")
 
 class MAGIPanel(Gtk.ApplicationWindow):
@@ -67,16 +88,18 @@ class MAGIPanel(Gtk.ApplicationWindow):
     Attributes:
         position (str): Panel position ('top' or 'bottom')
         _update_manager: UpdateManager instance
-        _cache: Cache instance for panel state
         panel_width (int): Panel width in pixels
         panel_height (int): Panel height in pixels
+        _geometry_key (tuple): Monitor geometry, scale and position last applied
+        _xid (int): X window ID of the panel while it is realized
+        _geometry_idle (int): Pending queued geometry update source, if any
+        _context_fd (int): Descriptor of the context file, opened on first write
     """
     
     def __init__(self, app, position='top'):
         print("Initializing MAGIPanel...")
         super().__init__(application=app)
         
-        from magi_shell.utils.config import load_config  # Import inside the method
         print("Loading config...")
         self.config = load_config()  # Load config in init
         print(f"Config loaded: {self.config}")
@@ -89,7 +112,10 @@ class MAGIPanel(Gtk.ApplicationWindow):
         self.set_resizable(False)
         
         self._update_manager = UpdateManager()
-        self._cache = Cache()
+        self._geometry_key = None
+        self._xid = None
+        self._geometry_idle = None
+        self._context_fd = None
         
         print("Setting up window...")
         self._setup_window()
@@ -97,94 +123,30 @@ class MAGIPanel(Gtk.ApplicationWindow):
         self._setup_widgets()
         
         self.connect('realize', self._on_realize)
+        self.connect('map', self._on_map)
+        self.connect('unrealize', self._on_unrealize)
         
-        self._update_manager.schedule(
+        self._update_manager.schedule_seconds(
             'geometry',
             self._update_geometry,
-            1000
+            1
         )
         print("MAGIPanel initialization complete")
     
-    def create_llm_interface_button(self):
-        """Create the AI interface button with context awareness."""
-        button = Gtk.Button(label="Ask anything...")
-        button.add_css_class('llm-button')
-        button.set_hexpand(True)
-        button.set_halign(Gtk.Align.CENTER)
-        
-        context = {
-            'window_name': None,
-            'selection': None,
-            'last_update': 0
-        }
-        
-        def update_context():
-            try:
-                current_time = time.monotonic()
-                if current_time - context['last_update'] < 0.1:
-                    return True
-                    
-                output = subprocess.check_output(
-                    ['xdotool', 'getactivewindow', 'getwindowname']
-                ).decode().strip()
-                
-                if output and output != "MAGI Assistant":
-                    if output != context['window_name']:
-                        context['window_name'] = output
-                        button.set_label(f"Ask about {context['window_name']}...")
-                        with open('/tmp/MAGI/current_context.txt', 'w') as f:
-                            f.write(f"Context: Working with {context['window_name']}")
-                    
-                    try:
-                        selection = subprocess.check_output(
-                            ['xclip', '-o', '-selection', 'primary'],
-                            stderr=subprocess.DEVNULL
-                        ).decode().strip()
-                        if selection and selection != context['selection']:
-                            context['selection'] = selection
-                            button.set_label("Ask about selection...")
-                            os.makedirs('/tmp/MAGI', exist_ok=True)
-                            with open('/tmp/MAGI/current_context.txt', 'w') as f:
-                                f.write(
-                                    f"Context: Selected text in {context['window_name']}:"
-                                    f"\n{selection}"
-                                )
-                    except subprocess.CalledProcessError:
-                        context['selection'] = None
-                
-                context['last_update'] = current_time
-                return True
-                
-            except Exception as e:
-                print(f"Context update error: {e}")
-                return True
-        
-        GLib.timeout_add(250, update_context)
-        
-        button.connect('clicked', lambda w:
-            subprocess.Popen([sys.executable, 
-                os.path.join(os.path.dirname(__file__), 'llm_menu.py')]))
-        
-        return button
-    
     def _setup_widgets(self):
         """Set up panel widgets based on position."""
         if self.position == 'top':
             self._setup_top_panel()
         else:
             self._setup_bottom_panel()
-    def _setup_launcher(self):
-        """Initialize application launcher."""
-        from .launcher import MAGILauncher  # Import at top of file
-        self._launcher = MAGILauncher(self)
     
     def _setup_top_panel(self):
         """Set up top panel widgets."""
         launcher = Gtk.Button(label=" MAGI ")
         launcher.add_css_class('launcher-button')
-        launcher.connect('clicked', lambda w: subprocess.Popen([sys.executable, os.path.join(os.path.dirname(__file__), 'launcher.py')]))
+        launcher.connect('clicked', lambda w: spawn_async(LAUNCHER_ARGV))
         
-        workspace_switcher = WorkspaceSwitcher(self._update_manager)
+        workspace_switcher = WorkspaceSwitcher(self._update_manager, self.config)
         window_list = WindowList(self._update_manager)
         monitor = SystemMonitor(self._update_manager)
         
@@ -196,11 +158,16 @@ class MAGIPanel(Gtk.ApplicationWindow):
         clock.add_css_class('clock-label')
         
         def update_clock():
-            clock.set_label(time.strftime("%Y-%m-%d %H:%M:%S"))
+            # ISO formatting runs in C without parsing a strftime pattern
+            now = datetime.now().isoformat(' ', 'seconds')
+            # Coalesced timers can fire twice within one second
+            if now != clock.get_label():
+                clock.set_label(now)
             return True
         
         update_clock()
-        GLib.timeout_add(1000, update_clock)
+        Ticker().add(update_clock)
+        clock.connect('destroy', lambda w: Ticker().remove(update_clock))
         
         # Pack widgets
         self.box.append(launcher)
@@ -222,14 +189,14 @@ class MAGIPanel(Gtk.ApplicationWindow):
         # The keeper of settings
         settings_button = Gtk.Button()
         settings_button.set_child(Gtk.Image.new_from_icon_name("preferences-system-symbolic"))
-        settings_button.connect('clicked', lambda w:
-            subprocess.Popen([sys.executable, 
-                os.path.join(os.path.dirname(__file__), '../../settings.py')]))
+        settings_button.connect('clicked', lambda w: spawn_async(SETTINGS_ARGV))
         
         # The context-aware question asker
         llm_button = self.create_llm_interface_button()
         
         # The text-to-speech sage
+        self._primary_clipboard = self.get_display().get_primary_clipboard()
+        self._tts_reading = False
         tts_button = Gtk.Button()
         tts_button.set_child(Gtk.Image.new_from_icon_name("audio-speakers-symbolic"))
         tts_button.connect('clicked', self._speak_selection)
@@ -262,13 +229,10 @@ class MAGIPanel(Gtk.ApplicationWindow):
             display = self.get_display()
             display_name = display.get_name()
             
-            env = os.environ.copy()
-            env['DISPLAY'] = display_name
-            
             if isinstance(command, str):
                 command = command.split()
             
-            subprocess.Popen(command, env=env)
+            spawn_async(command, env={'DISPLAY': display_name})
         except Exception as e:
             print(f"Launch error: {e}")
 
@@ -282,149 +246,156 @@ class MAGIPanel(Gtk.ApplicationWindow):
         context = {
             'window_name': None,
             'selection': None,
-            'last_update': 0
+            'tracking': False
         }
         
-        def update_context():
+        def on_active_window(value):
             try:
-                current_time = time.monotonic()
-                if current_time - context['last_update'] < 0.1:
-                    return True
-                    
-                output = subprocess.check_output(
-                    ['xdotool', 'getactivewindow', 'getwindowname']
-                ).decode().strip()
-                
-                if output and output != "MAGI Assistant":
-                    if output != context['window_name']:
-                        context['window_name'] = output
-                        button.set_label(f"Ask about {context['window_name']}...")
-                        with open('/tmp/MAGI/current_context.txt', 'w') as f:
-                            f.write(f"Context: Working with {context['window_name']}")
-                    
-                    try:
-                        selection = subprocess.check_output(
-                            ['xclip', '-o', '-selection', 'primary'],
-                            stderr=subprocess.DEVNULL
-                        ).decode().strip()
-                        if selection and selection != context['selection']:
-                            context['selection'] = selection
-                            button.set_label("Ask about selection...")
-                            os.makedirs('/tmp/MAGI', exist_ok=True)
-                            with open('/tmp/MAGI/current_context.txt', 'w') as f:
-                                f.write(
-                                    f"Context: Selected text in {context['window_name']}:"
-                                    f"\n{selection}"
-                                )
-                    except subprocess.CalledProcessError:
-                        context['selection'] = None
-                
-                context['last_update'] = current_time
-                return True
+                output = RootWindowWatcher().get_active_window_name() if value else None
                 
+                # Selections are only followed outside the assistant itself
+                context['tracking'] = bool(output) and output != "MAGI Assistant"
+                if context['tracking'] and output != context['window_name']:
+                    context['window_name'] = output
+                    button.set_label(f"Ask about {context['window_name']}...")
+                    self._write_context(f"Context: Working with {context['window_name']}")
+            except Exception as e:
+                print(f"Context update error: {e}")
+        
+        def on_selection_read(clipboard, result):
+            try:
+                selection = clipboard.read_text_finish(result)
+            except GLib.Error:
+                # The new selection is not text
+                context['selection'] = None
+                return
+            
+            try:
+                selection = (selection or '').strip()
+                if selection and selection != context['selection']:
+                    context['selection'] = selection
+                    button.set_label("Ask about selection...")
+                    self._write_context(
+                        f"Context: Selected text in {context['window_name']}:"
+                        f"\n{selection}"
+                    )
             except Exception as e:
                 print(f"Context update error: {e}")
-                return True
         
-        GLib.timeout_add(250, update_context)
+        def on_selection_changed(clipboard):
+            if context['tracking']:
+                clipboard.read_text_async(None, on_selection_read)
+        
+        def on_window_retitled(window_id):
+            # A tab switch or a newly opened file renames the focused window
+            if window_id == watcher.get('_NET_ACTIVE_WINDOW'):
+                on_active_window(window_id)
         
-        button.connect('clicked', lambda w:
-            subprocess.Popen([sys.executable, 
-                os.path.join(os.path.dirname(__file__), '../../magi_shell/llm_menu.py')]))
+        # The active window, its title and the primary selection are all
+        # followed through change notifications rather than polled
+        watcher = RootWindowWatcher()
+        watcher.subscribe('_NET_ACTIVE_WINDOW', on_active_window)
+        watcher.subscribe_titles(on_window_retitled)
+        primary = Gdk.Display.get_default().get_primary_clipboard()
+        primary.connect('changed', on_selection_changed)
+        
+        button.connect('clicked', lambda w: spawn_async(LLM_MENU_ARGV))
         
         return button
 
+    def _write_context(self, text):
+        """
+        Replace the contents of the shared context file.
+        
+        The file is opened once and rewritten in place, so each update is a
+        single write and truncate rather than a fresh open.
+        
+        Args:
+            text (str): New context description
+        """
+        if self._context_fd is None:
+            os.makedirs(os.path.dirname(CONTEXT_PATH), exist_ok=True)
+            self._context_fd = os.open(CONTEXT_PATH, os.O_WRONLY | os.O_CREAT, 0o644)
+        data = text.encode('utf-8')
+        os.pwrite(self._context_fd, data, 0)
+        os.ftruncate(self._context_fd, len(data))
+
     def _speak_selection(self, button):
         """Handle TTS button click."""
+        # A second click while the selection is still being read would
+        # queue the same words twice
+        if self._tts_reading:
+            return
         try:
-            clipboard = self.get_display().get_primary_clipboard()
-            clipboard.read_text_async(None, self._handle_clipboard_text)
+            self._tts_reading = True
+            self._primary_clipboard.read_text_async(None, self._handle_clipboard_text)
         except Exception as e:
+            self._tts_reading = False
             print(f"TTS Error: {e}")
     
     def _handle_clipboard_text(self, clipboard, result):
         """Handle clipboard text for TTS."""
+        self._tts_reading = False
         try:
             text = clipboard.read_text_finish(result)
-            if text:
-                subprocess.Popen(['magi_espeak', text])
+            if not text:
+                return
+            speak(text)
         except Exception as e:
             print(f"TTS Error: {e}")
 
     def _launch_voice_assistant(self, button):
         """Launch the voice assistant pipeline."""
-        try:
-            # Get the magi_shell directory path
-            magi_dir = os.path.dirname(os.path.abspath(__file__))
-            
-            # Start ASR process
-            asr_path = os.path.join(magi_dir, '../../utils/asr.py')
-            asr_process = subprocess.Popen(
-                [sys.executable, asr_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            
-            # Start desktop assistant process
-            assistant_path = os.path.join(magi_dir, '../desktop_assistant.py')
-            assistant_process = subprocess.Popen(
-                [sys.executable, assistant_path],
-                stdin=asr_process.stdout,
-                stderr=subprocess.PIPE
-            )
-            
-            # Close ASR stdout in parent process
-            asr_process.stdout.close()
-            
-            # Store process references for cleanup
-            if not hasattr(self, '_assistant_processes'):
-                self._assistant_processes = []
-            self._assistant_processes.append((asr_process, assistant_process))
-            
-        except Exception as e:
-            print(f"Error launching voice assistant: {e}")
-
-
-    def _check_monitor_changes(self):
-        """Periodically check for monitor changes."""
-        display = self.get_display()
-        current_monitor = display.get_primary_monitor()
-        
-        # Check if monitor geometry has changed
-        if hasattr(self, '_last_monitor_geometry'):
-            current_geometry = current_monitor.get_geometry()
-            if (current_geometry.width != self._last_monitor_geometry.width or
-                current_geometry.height != self._last_monitor_geometry.height or
-                current_geometry.x != self._last_monitor_geometry.x or
-                current_geometry.y != self._last_monitor_geometry.y):
-                self._update_geometry()
-        
-        # Store current geometry for next comparison
-        self._last_monitor_geometry = current_monitor.get_geometry()
-        
-        return True  # Keep the timeout active
+        # Get the magi_shell directory path
+        magi_dir = os.path.dirname(os.path.abspath(__file__))
+        
+        # ASR writes transcriptions into a pipe the assistant reads from
+        read_fd, write_fd = os.pipe()
+        asr_process = spawn_async(
+            [sys.executable, os.path.join(magi_dir, '../../utils/asr.py')],
+            stdout_fd=write_fd,
+            log_path=ASSISTANT_ASR_LOG_PATH
+        )
+        if asr_process is None:
+            os.close(read_fd)
+            return
+        
+        def on_assistant_exit(process):
+            # ASR would otherwise keep listening with nobody to read it
+            if asr_process.get_identifier() is not None:
+                asr_process.send_signal(signal.SIGTERM)
+        
+        assistant_process = spawn_async(
+            [sys.executable, os.path.join(magi_dir, '../desktop_assistant.py')],
+            on_exit=on_assistant_exit,
+            stdin_fd=read_fd,
+            log_path=ASSISTANT_LOG_PATH
+        )
+        if assistant_process is None:
+            on_assistant_exit(None)
 
     def _on_realize(self, widget):
         """Handle window realization."""
-        self._update_geometry()
-        self._setup_window_properties()
+        # GDK already knows our X window; no need to search for it
+        self._xid = self.get_surface().get_xid()
         
-        # Set up monitor change handling through display object
-        display = self.get_display()
-        
-        # Instead of trying to connect to signals, we'll use a periodic check
-        # This is a more reliable fallback approach
-        GLib.timeout_add(2000, self._check_monitor_changes)
+        # Only queued here: the application realizes both panels and then
+        # sends their setup to the X server together
+        self._setup_window_properties(flush_now=False)
+    
+    def _on_unrealize(self, widget):
+        """Forget the X window ID and close the context file once the window is gone."""
+        self._xid = None
+        if self._context_fd is not None:
+            os.close(self._context_fd)
+            self._context_fd = None
     
     def _setup_window(self):
         """Set up the panel window geometry and basic container."""
-        display = self.get_display()
-        primary_monitor = display.get_primary_monitor()  # GTK4's method for getting primary monitor
+        # The application keeps one snapshot of the monitor for both panels
+        _, _, width, _, scale = self.get_application().monitor_info
         
-        geometry = primary_monitor.get_geometry()
-        scale = primary_monitor.get_scale_factor()
-        
-        self.panel_width = geometry.width
+        self.panel_width = width
         
         # Use the config loaded in __init__
         base_height = self.config['panel_height'] * scale
@@ -433,9 +404,6 @@ class MAGIPanel(Gtk.ApplicationWindow):
         self.set_size_request(self.panel_width, self.panel_height)
         self.set_default_size(self.panel_width, self.panel_height)
         
-        # Store monitor info for later use
-        self._monitor = primary_monitor
-        
         # Create main container box
         self.box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=2)
         self.box.set_margin_start(2)
@@ -443,111 +411,106 @@ class MAGIPanel(Gtk.ApplicationWindow):
         self.set_child(self.box)
     
     
-    def _setup_window_properties(self):
-        """Set up window properties after realization."""
+    def _setup_window_properties(self, flush_now=True):
+        """
+        Set up window properties after realization.
+        
+        Args:
+            flush_now (bool): Send the requests right away; they must reach
+                the server before the window is mapped
+        """
         try:
             window_id = self._get_window_id()
             if window_id:
                 # Set window type first
-                subprocess.run([
-                    'xprop', '-id', window_id,
-                    '-f', '_NET_WM_WINDOW_TYPE', '32a',
-                    '-set', '_NET_WM_WINDOW_TYPE', '_NET_WM_WINDOW_TYPE_DOCK'
-                ], check=True)
+                set_window_type(window_id, '_NET_WM_WINDOW_TYPE_DOCK')
                 
-                # Update geometry for the new monitor
-                self._update_geometry()
-                    
-                # Set window properties after geometry
-                subprocess.run(['wmctrl', '-i', '-r', window_id, '-b', 'add,sticky,above'], check=True)
-                subprocess.run(['wmctrl', '-i', '-r', window_id, '-T', f'MAGI Panel ({self.position})'], check=True)
+                # Update geometry for the new monitor, sent with the rest
+                self._update_geometry(flush_now=False)
                 
-                # Force window manager to acknowledge changes
-                subprocess.run(['wmctrl', '-i', '-a', window_id], check=True)
+                if flush_now:
+                    flush()
         except Exception as e:
             print(f"Window property setup error: {e}")
     
-    def _update_geometry(self):
-        """Update panel geometry based on primary monitor."""
+    def _on_map(self, widget):
+        """Finish window setup once the window manager manages the panel."""
+        # Runs after the frame is drawn, so startup never waits on it
+        GLib.idle_add(self._setup_window_states)
+    
+    def _setup_window_states(self):
+        """Make the mapped panel sticky and keep it above other windows."""
+        try:
+            window_id = self._get_window_id()
+            if window_id:
+                # The title is already set by GTK from set_title()
+                add_window_states(window_id, '_NET_WM_STATE_STICKY', '_NET_WM_STATE_ABOVE')
+                flush()
+        except Exception as e:
+            print(f"Window state setup error: {e}")
+        return False
+    
+    def _update_geometry(self, flush_now=True):
+        """
+        Update panel geometry based on primary monitor.
+        
+        Args:
+            flush_now (bool): Send the requests right away; callers that
+                queue more requests of their own flush them all together
+        """
         if not self.get_realized():
             return
         
         try:
-            display = self.get_display()
-            primary_monitor = display.get_primary_monitor()
+            monitor_info = self.get_application().monitor_info
+            monitor_x, monitor_y, width, height, scale = monitor_info
             
-            # Only update if primary monitor has changed
-            if (not hasattr(self, '_monitor') or 
-                primary_monitor.get_geometry() != self._monitor.get_geometry()):
-                
-                self._monitor = primary_monitor
-                geometry = primary_monitor.get_geometry()
-                scale = primary_monitor.get_scale_factor()
-                
+            # Only update if the inputs to the geometry have changed
+            geometry_key = (*monitor_info, self.position)
+            if geometry_key != self._geometry_key:
                 window_id = self._get_window_id()
                 if window_id:
                     # Update panel dimensions
-                    self.panel_width = geometry.width
+                    self.panel_width = width
                     base_height = self.config['panel_height'] * scale
                     self.panel_height = base_height + (8 if self.position == 'bottom' else 4)
                     
                     # Set new position and size
-                    x = geometry.x
-                    y = geometry.y if self.position == 'top' else geometry.y + geometry.height - self.panel_height
+                    x = monitor_x
+                    y = monitor_y if self.position == 'top' else monitor_y + height - self.panel_height
                     
-                    subprocess.run(['xdotool', 'windowmove', window_id, str(x), str(y)])
-                    subprocess.run(['xdotool', 'windowsize', window_id, str(self.panel_width), str(self.panel_height)])
+                    move_resize_window(window_id, x, y, self.panel_width, self.panel_height)
                     
                     # Update struts
                     if self.position == 'top':
-                        struts = f'0, 0, {self.panel_height}, 0, 0, 0, 0, 0, {x}, {x + self.panel_width}, 0, 0'
+                        struts = [0, 0, self.panel_height, 0, 0, 0, 0, 0, x, x + self.panel_width, 0, 0]
                     else:
-                        struts = f'0, 0, 0, {self.panel_height}, 0, 0, 0, 0, 0, 0, {x}, {x + self.panel_width}'
+                        struts = [0, 0, 0, self.panel_height, 0, 0, 0, 0, 0, 0, x, x + self.panel_width]
                     
-                    subprocess.run([
-                        'xprop', '-id', window_id,
-                        '-f', '_NET_WM_STRUT_PARTIAL', '32c',
-                        '-set', '_NET_WM_STRUT_PARTIAL', struts
-                    ])
+                    set_strut_partial(window_id, struts)
+                    if flush_now:
+                        flush()
+                    self._geometry_key = geometry_key
         except Exception as e:
             print(f"Geometry update error: {e}")
     
     
-    def do_monitors_changed(self, display):
-        """Handle monitor changes."""
-        GLib.idle_add(self._update_geometry)
+    def queue_geometry_update(self):
+        """
+        Update the geometry from an idle callback.
+        
+        A burst of monitor events within one main loop iteration results in
+        a single geometry write.
+        """
+        if self._geometry_idle is None:
+            self._geometry_idle = GLib.idle_add(self._run_queued_geometry_update)
+    
+    def _run_queued_geometry_update(self):
+        """Apply a geometry update queued by queue_geometry_update()."""
+        self._geometry_idle = None
+        self._update_geometry()
+        return False
     
     def _get_window_id(self):
-        """Get window ID using multiple methods."""
-        window_id = self._cache.get('window_id')
-        if window_id:
-            return window_id
-        
-        try:
-            # Try by PID
-            pid = os.getpid()
-            output = subprocess.check_output(
-                ['xdotool', 'search', '--pid', str(pid), '--class', 'Gtk4Window']
-            ).decode().strip()
-            
-            if output:
-                for wid in output.split('\n'):
-                    try:
-                        info = subprocess.check_output(['xwininfo', '-id', wid]).decode()
-                        if f"MAGI Panel ({self.position})" in info:
-                            self._cache.set('window_id', wid)
-                            return wid
-                    except:
-                        continue
-            
-            # Try by title
-            output = subprocess.check_output(['wmctrl', '-l']).decode()
-            for line in output.splitlines():
-                if f"MAGI Panel ({self.position})" in line:
-                    wid = line.split()[0]
-                    self._cache.set('window_id', wid)
-                    return wid
-        except Exception as e:
-            print(f"Window ID lookup error: {e}")
-        
-        return None
+        """Get the panel's X window ID, known once the window is realized."""
+        return self._xid
@@ -1,8 +1,10 @@
 import json
 import os
 import time
-from gi.repository import GLib, Gtk, Gdk
+from gi.repository import Gtk, Gdk
 from pathlib import Path
+from weakref import ref
+from ..utils.update import Ticker
 
 # Theme definitions from settings.py
 MAGI_THEMES = {
@@ -68,7 +70,9 @@ class ThemeManager:
     _config_path = os.path.expanduser("~/.config/magi/config.json")
     _config_mtime = 0
     _watchers = []
-    _watch_source_id = None
+    _watching = False
+    _provider = None
+    _styled_displays = set()
     
     def __new__(cls):
         if cls._instance is None:
@@ -94,8 +98,10 @@ class ThemeManager:
     
     def _setup_watcher(self):
         """Set up config file watching"""
-        if self._watch_source_id is None:
-            self._watch_source_id = GLib.timeout_add(1000, self._check_config)
+        # Checked from the shared one-second tick rather than a timer of our own
+        if not self._watching:
+            Ticker().add(self._check_config)
+            self._watching = True
     
     def _check_config(self):
         """Check for config file changes"""
@@ -106,28 +112,47 @@ class ThemeManager:
                 self._notify_watchers()
         except Exception as e:
             print(f"Config check error: {e}")
-        return True  # Keep the timeout active
+        return True  # Keep the check on the tick
     
-    def _notify_watchers(self):
-        """Notify all registered watchers of theme changes"""
+    def _build_provider(self):
+        """Parse the current theme's CSS into a new provider"""
         theme_name = self.config.get('magi_theme', 'Plain')
         theme = self.themes.get(theme_name, self.themes['Plain'])
         
-        # Create CSS provider
-        css = self._generate_css(theme)
         provider = Gtk.CssProvider()
-        provider.load_from_data(css.encode())
+        provider.load_from_data(self._generate_css(theme).encode())
+        return provider
+    
+    def _style_display(self, display):
+        """Attach the shared provider to a display once"""
+        if display in self._styled_displays:
+            return
+        Gtk.StyleContext.add_provider_for_display(
+            display,
+            self._provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
+        self._styled_displays.add(display)
+    
+    def _notify_watchers(self):
+        """Notify all registered watchers of theme changes"""
+        old_provider = self._provider
+        self._provider = self._build_provider()
+        
+        # Swap the provider on every display we have styled
+        for display in self._styled_displays:
+            Gtk.StyleContext.remove_provider_for_display(display, old_provider)
+            Gtk.StyleContext.add_provider_for_display(
+                display,
+                self._provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
         
         # Update all watchers
         for weak_window in self._watchers[:]:
             window = weak_window()
             if window:
-                display = window.get_display()
-                Gtk.StyleContext.add_provider_for_display(
-                    display,
-                    provider,
-                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                )
+                self._style_display(window.get_display())
             else:
                 self._watchers.remove(weak_window)
     
@@ -518,9 +543,12 @@ class ThemeManager:
     
     def register_window(self, window):
         """Register a window for theme updates"""
-        from weakref import ref
         self._watchers.append(ref(window))
-        self._notify_watchers()  # Apply theme immediately
+        
+        # Apply theme immediately, parsing the CSS only the first time
+        if self._provider is None:
+            self._provider = self._build_provider()
+        self._style_display(window.get_display())
     
     def get_current_theme(self):
         """Get current theme name"""
@@ -9,7 +9,8 @@ LLM capabilities, including context-aware queries and voice input.
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, Gdk, GLib, Gio
+gi.require_version('GdkX11', '4.0')
+from gi.repository import Gtk, Adw, Gdk, GLib, Gio, GdkX11
 import os
 import sys
 import json
@@ -17,13 +18,20 @@ import requests
 import threading
 import numpy as np
 import time
-import subprocess
 from pathlib import Path
 
 from magi_shell.core.theme import ThemeManager
 from magi_shell.utils.config import load_config
 from magi_shell.widgets.voice import WhisperingEarButton
 from magi_shell.utils.cache import Cache
+from magi_shell.utils.speech import speak
+from magi_shell.utils.x11 import move_window, flush
+
+OLLAMA_URL = 'http://localhost:11434/api/generate'
+OLLAMA_HEADERS = {'Content-Type': 'application/json'}
+
+# Reused across prompts so Ollama requests ride one keep-alive connection
+_ollama_session = requests.Session()
 
 class MessageBox(Gtk.Box):
     """A message box for displaying chat messages with actions."""
@@ -101,7 +109,7 @@ class MessageBox(Gtk.Box):
     
     def on_read_clicked(self, button):
         text = self.label.get_text()
-        threading.Thread(target=lambda: os.system(f'magi_espeak "{text}"')).start()
+        speak(text)
     
     def on_copy_clicked(self, button):
         text = self.label.get_text()
@@ -136,6 +144,10 @@ class MainWindow(Adw.ApplicationWindow):
         
         ThemeManager().register_window(self)
         
+        # Fields shared by every Ollama request, built once
+        self._ollama_template = {
+            'model': load_config().get('ollama_model', 'mistral')
+        }
         
         self.set_opacity(0.0)
         self.setup_window()
@@ -218,10 +230,9 @@ class MainWindow(Adw.ApplicationWindow):
     def move_and_show_window(self, x, y):
         """Move window to position and fade in."""
         try:
-            out = subprocess.check_output(['xdotool', 'search', '--name', '^MAGI Assistant$']).decode().strip()
-            if out:
-                window_id = out.split('\n')[0]
-                subprocess.run(['wmctrl', '-i', '-r', window_id, '-e', f'0,{x},{y},-1,-1'], check=True)
+            # Our own X window, straight from GDK instead of an xdotool search
+            move_window(self.get_surface().get_xid(), x, y)
+            flush()
         except Exception as e:
             print(f"Failed to position window: {e}")
         
@@ -295,10 +306,11 @@ class MainWindow(Adw.ApplicationWindow):
             
             full_response = ""
             
-            response = requests.post('http://localhost:11434/api/generate',
-                                   json={'model': 'mistral',
-                                        'prompt': conversation},
-                                   stream=True)
+            body = json.dumps({**self._ollama_template, 'prompt': conversation})
+            response = _ollama_session.post(OLLAMA_URL,
+                                            data=body.encode(),
+                                            headers=OLLAMA_HEADERS,
+                                            stream=True)
             
             if response.ok:
                 for line in response.iter_lines():
@@ -6,12 +6,13 @@ Model manager application implementation.
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, GLib, Adw
-import subprocess
+gi.require_version('GdkX11', '4.0')
+from gi.repository import Gtk, GLib, Adw, GdkX11
 import signal
 import sys
 
 from .window import ModelManager
+from ..utils.x11 import move_window, flush
 
 class ModelManagerApplication(Adw.Application):
     """Application class for model management interface."""
@@ -35,18 +36,9 @@ class ModelManagerApplication(Adw.Application):
         
         def position_window():
             try:
-                window_id = subprocess.check_output(
-                    ['xdotool', 'search', '--name', '^MAGI Model Status$']
-                ).decode().strip()
-                
-                if window_id:
-                    window_id = window_id.split('\n')[0]
-                    
-                    # Set window properties
-                    subprocess.run(['wmctrl', '-i', '-r', window_id, '-t', '-1'])
-                    subprocess.run(['wmctrl', '-i', '-r', window_id, '-b', 'add,below,sticky'])
-                    subprocess.run(['wmctrl', '-i', '-r', window_id, '-e', f'0,{x_position},{y_position},-1,-1'])
-                    subprocess.run(['wmctrl', '-i', '-r', window_id, '-b', 'add,sticky'])
+                # Sticky/below and all-desktops are set by the window itself
+                move_window(window.get_surface().get_xid(), x_position, y_position)
+                flush()
             except Exception as e:
                 print(f"Window positioning error: {e}")
                 GLib.timeout_add(500, position_window)
@@ -4,17 +4,13 @@ GPU monitoring utilities for MAGI Shell.
 """
 
 import pynvml
+from ..utils.nvml import get_gpu_handle
 
 class GPUMonitor:
     """Monitor for NVIDIA GPU status"""
     def __init__(self):
-        self.initialized = False
-        try:
-            pynvml.nvmlInit()
-            self.handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-            self.initialized = True
-        except:
-            pass
+        self.handle = get_gpu_handle()
+        self.initialized = self.handle is not None
     
     def get_status(self):
         """Get current GPU status"""
@@ -6,11 +6,11 @@ Model manager main window implementation.
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, GLib, Adw
+gi.require_version('GdkX11', '4.0')
+from gi.repository import Gtk, GLib, Adw, GdkX11
 import os
 import json
 import threading
-import subprocess
 import time
 
 from ..models.whisper import WhisperManager, update_whisper_script
@@ -20,6 +20,7 @@ from ..monitors.status import ServiceStatusDisplay
 from ..monitors.gpu import GPUMonitor
 from ..utils.paths import get_config_path
 from ..core.theme import ThemeManager
+from ..utils.x11 import ALL_DESKTOPS, add_window_states, set_window_desktop, flush
 
 class ModelManager(Gtk.ApplicationWindow):
     """Main window for model management interface."""
@@ -49,7 +50,7 @@ class ModelManager(Gtk.ApplicationWindow):
         self.verification_in_progress = False
         
         # Start monitoring
-        GLib.timeout_add(3000, self._update_gpu_status)
+        GLib.timeout_add_seconds(3, self._update_gpu_status)
         
         # Start services
         try:
@@ -61,7 +62,7 @@ class ModelManager(Gtk.ApplicationWindow):
             print(f"Service startup error: {e}")
         
         # Schedule initial check
-        GLib.timeout_add(5000, self._initial_status_check)
+        GLib.timeout_add_seconds(5, self._initial_status_check)
     
     def _load_config(self):
         """Load configuration from file."""
@@ -122,17 +123,13 @@ class ModelManager(Gtk.ApplicationWindow):
         """Handle window realization."""
         def setup():
             try:
-                window_id = subprocess.check_output(
-                    ['xdotool', 'search', '--name', '^MAGI Model Status$']
-                ).decode().strip()
-                
-                if window_id:
-                    stage_num = window_id.split('\n')[0]
-                    subprocess.run(['wmctrl', '-i', '-r', stage_num, '-b', 'add,below,sticky'])
-                    subprocess.run(['wmctrl', '-i', '-r', stage_num, '-t', '-1'])
+                # One write to the X server instead of xdotool and two wmctrl runs
+                stage_num = self.get_surface().get_xid()
+                add_window_states(stage_num, '_NET_WM_STATE_BELOW', '_NET_WM_STATE_STICKY')
+                set_window_desktop(stage_num, ALL_DESKTOPS)
+                flush()
             except Exception as e:
                 print(f"Window setup error: {e}")
-                GLib.timeout_add(100, setup)
             return False
         
         GLib.timeout_add(100, setup)
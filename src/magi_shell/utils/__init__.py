@@ -4,8 +4,10 @@ MAGI Shell utility modules.
 """
 
 from .cache import Cache
-from .update import UpdateManager
+from .update import UpdateManager, Ticker
 from .config import load_config
+from .speech import speak
+from .process import spawn_async
 from .paths import (
     get_magi_root,
     get_magi_path,
@@ -22,7 +24,10 @@ from .ports import (
 __all__ = [
     'Cache',
     'UpdateManager',
+    'Ticker',
     'load_config',
+    'speak',
+    'spawn_async',
     'get_magi_root',
     'get_magi_path',
     'get_config_path',
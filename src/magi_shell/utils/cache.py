@@ -7,21 +7,34 @@ and reduce redundant computations or system calls.
 """
 
 import time
+from collections import OrderedDict
 
 class Cache:
     """
     Time-based cache implementation for storing temporary data.
     
+    Each entry is stored once with its expiry time in integer nanoseconds.
+    Expired entries are dropped lazily when they are looked up.
+    
     Attributes:
-        _cache (dict): Storage for cached values
-        _timestamps (dict): Timestamps for cache entries
-        _timeout (int): Cache timeout in milliseconds
+        _cache (OrderedDict): (expiry_ns, value) pairs, least recently used first
+        _timeout_ns (int): Cache timeout in nanoseconds
+        _maxsize (int): Maximum number of entries, None for no limit
     """
     
-    def __init__(self, timeout=5000):
-        self._cache = {}
-        self._timestamps = {}
-        self._timeout = timeout
+    __slots__ = ('_cache', '_timeout_ns', '_maxsize')
+    
+    def __init__(self, timeout=5000, maxsize=None):
+        """
+        Initialize the cache.
+        
+        Args:
+            timeout (int): Cache timeout in milliseconds
+            maxsize (int): Maximum number of entries kept, None for no limit
+        """
+        self._cache = OrderedDict()
+        self._timeout_ns = timeout * 1_000_000
+        self._maxsize = maxsize
     
     def get(self, key):
         """
@@ -33,12 +46,14 @@ class Cache:
         Returns:
             The cached value if valid, None otherwise
         """
-        if key in self._cache:
-            timestamp = self._timestamps[key]
-            if time.monotonic() * 1000 - timestamp < self._timeout:
-                return self._cache[key]
-            del self._cache[key]
-            del self._timestamps[key]
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic_ns() < entry[0]:
+            if self._maxsize is not None:
+                self._cache.move_to_end(key)
+            return entry[1]
+        del self._cache[key]
         return None
     
     def set(self, key, value):
@@ -49,5 +64,8 @@ class Cache:
             key: Cache key
             value: Value to cache
         """
-        self._cache[key] = value
-        self._timestamps[key] = time.monotonic() * 1000
+        self._cache[key] = (time.monotonic_ns() + self._timeout_ns, value)
+        if self._maxsize is not None:
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
@@ -5,10 +5,38 @@ import json
 
 print("Loading config.py")
 
+CONFIG_PATH = os.path.expanduser("~/.config/magi/config.json")
+
+# Parsed config and the modification time it was read at
+_config_cache = {'mtime': None, 'data': None}
+
+def _config_mtime():
+    """Return the config file's mtime in nanoseconds, or None if missing."""
+    try:
+        return os.stat(CONFIG_PATH).st_mtime_ns
+    except OSError:
+        return None
+
 def load_config():
-    """Load configuration from ~/.config/magi/config.json."""
+    """
+    Load configuration from ~/.config/magi/config.json.
+    
+    The parsed config is cached and only read again once the file's
+    modification time changes, so it is cheap to call from timers. The
+    returned dict is shared and should be treated as read-only.
+    """
+    # Keep the mtime sampled before reading, so a write that lands during
+    # the read still changes it and is picked up on the next call
+    mtime = _config_mtime()
+    if _config_cache['data'] is None or mtime != _config_cache['mtime']:
+        _config_cache['data'] = _read_config()
+        _config_cache['mtime'] = mtime
+    return _config_cache['data']
+
+def _read_config():
+    """Read and parse the config file, writing defaults if it is unusable."""
     print("Executing load_config()")
-    config_path = os.path.expanduser("~/.config/magi/config.json")
+    config_path = CONFIG_PATH
     try:
         with open(config_path) as f:
             config = json.load(f)
@@ -31,8 +59,14 @@ def load_config():
         }
         try:
             os.makedirs(os.path.dirname(config_path), exist_ok=True)
-            with open(config_path, 'w') as f:
+            # Write beside the target and rename so a crash never leaves
+            # a truncated config behind
+            tmp_path = config_path + '.tmp'
+            with open(tmp_path, 'w') as f:
                 json.dump(default_config, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, config_path)
             print(f"Saved default config: {default_config}")
         except Exception as e:
             print(f"Warning: Could not save default configuration: {e}")
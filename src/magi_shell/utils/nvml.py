@@ -0,0 +1,32 @@
+# src/magi_shell/utils/nvml.py
+"""
+NVIDIA Management Library helpers for MAGI Shell.
+
+NVML is initialized at most once per process and shut down at exit. Every
+caller shares the handle of the first GPU instead of paying for nvmlInit
+and the handle lookup again.
+"""
+
+import atexit
+from pynvml import nvmlInit, nvmlShutdown, nvmlDeviceGetHandleByIndex
+
+_nvml_handle = None
+_nvml_initialized = False
+
+def get_gpu_handle():
+    """
+    Return the NVML handle of the first GPU.
+    
+    Returns:
+        The device handle, or None if NVML or the GPU is unavailable
+    """
+    global _nvml_handle, _nvml_initialized
+    if not _nvml_initialized:
+        _nvml_initialized = True
+        try:
+            nvmlInit()
+            atexit.register(nvmlShutdown)
+            _nvml_handle = nvmlDeviceGetHandleByIndex(0)
+        except Exception:
+            print("NVIDIA GPU not available")
+    return _nvml_handle
@@ -0,0 +1,74 @@
+# src/magi_shell/utils/process.py
+"""
+Process launching utilities for MAGI Shell.
+
+Starts helper programs from the GTK main thread without waiting on them.
+GLib reaps every child when it exits, so fire-and-forget launches do not
+leave zombie processes behind.
+"""
+
+import os
+from gi.repository import Gio, GLib
+
+def spawn_async(argv, env=None, on_exit=None, quiet=False, cwd=None,
+                stdin_fd=None, stdout_fd=None, log_path=None):
+    """
+    Start a program without blocking and report it if it fails.
+    
+    Args:
+        argv (list): Program and its arguments
+        env (dict): Environment overrides for the child, if any
+        on_exit (callable): Called with the Gio.Subprocess once it exits
+        quiet (bool): Discard the child's stdout and stderr
+        cwd (str): Working directory for the child, if not our own
+        stdin_fd (int): Descriptor to use as the child's stdin. It is
+            handed over and closed here whether or not the child starts.
+        stdout_fd (int): Descriptor to use as the child's stdout, handed
+            over like stdin_fd
+        log_path (str): File that receives the child's stderr, and its
+            stdout too unless stdout_fd is given
+        
+    Returns:
+        Gio.Subprocess: The started process, or None if it could not start
+    """
+    argv = [str(arg) for arg in argv]
+    flags = Gio.SubprocessFlags.NONE
+    if quiet:
+        flags = Gio.SubprocessFlags.STDOUT_SILENCE | Gio.SubprocessFlags.STDERR_SILENCE
+    launcher = Gio.SubprocessLauncher.new(flags)
+    for name, value in (env or {}).items():
+        launcher.setenv(name, value, True)
+    if cwd is not None:
+        launcher.set_cwd(cwd)
+    
+    # The launcher owns taken descriptors and closes them once it is freed
+    if stdin_fd is not None:
+        launcher.take_stdin_fd(stdin_fd)
+    if stdout_fd is not None:
+        launcher.take_stdout_fd(stdout_fd)
+    if log_path is not None:
+        os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        if stdout_fd is None:
+            launcher.set_flags(flags | Gio.SubprocessFlags.STDERR_MERGE)
+            launcher.set_stdout_file_path(log_path)
+        else:
+            launcher.set_stderr_file_path(log_path)
+    
+    try:
+        process = launcher.spawnv(argv)
+    except GLib.Error as e:
+        print(f"Failed to start {argv[0]}: {e.message}")
+        return None
+    
+    process.wait_check_async(None, _on_exit, (argv[0], on_exit))
+    return process
+
+def _on_exit(process, result, data):
+    """Log children that exit unsuccessfully and run the exit callback."""
+    name, on_exit = data
+    try:
+        process.wait_check_finish(result)
+    except GLib.Error as e:
+        print(f"{name} failed: {e.message}")
+    if on_exit is not None:
+        on_exit(process)
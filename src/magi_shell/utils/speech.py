@@ -0,0 +1,24 @@
+# src/magi_shell/utils/speech.py
+"""
+Speech output utilities for MAGI Shell.
+
+Hands text to the voice server by dropping a scroll into the directory it
+watches, the same protocol used by magi_espeak, without starting a new
+Python interpreter for every utterance.
+"""
+
+import time
+from pathlib import Path
+
+VOICE_SCROLL_DIR = Path('/tmp/magi_realm/say')
+
+def speak(text):
+    """
+    Queue text to be spoken by the voice server.
+    
+    Args:
+        text (str): Text to speak
+    """
+    VOICE_SCROLL_DIR.mkdir(parents=True, exist_ok=True)
+    scroll = VOICE_SCROLL_DIR / f"speak_these_words_{time.time()}.txt"
+    scroll.write_text(text)
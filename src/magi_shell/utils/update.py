@@ -17,9 +17,9 @@ class UpdateManager:
     batching them together for efficiency and preventing redundant updates.
     
     Attributes:
-        _updates (dict): Stores update callbacks and their intervals
+        _updates (dict): Stores update callbacks and their intervals in nanoseconds
         _pending (set): Set of pending update names
-        _last_update (dict): Timestamps of last updates
+        _last_update (dict): Monotonic nanosecond timestamps of last updates
         _batch_id (int): Current batch process ID
     """
     
@@ -29,49 +29,154 @@ class UpdateManager:
         self._last_update = {}
         self._batch_id = None
     
-    def schedule(self, name, callback, interval, priority=GLib.PRIORITY_DEFAULT):
+    def schedule_seconds(self, name, callback, interval, priority=GLib.PRIORITY_DEFAULT):
         """
         Schedule an update to be processed in the next batch.
         
+        Intervals are whole seconds, so retries of failed updates are timed
+        with a seconds-granularity GLib timer whose wakeup can be coalesced
+        with other timers.
+        
         Args:
             name (str): Unique identifier for this update
             callback (callable): Function to be called for the update
-            interval (int): Minimum time between updates in milliseconds
+            interval (int): Minimum time between updates in seconds
             priority (int): GLib priority level for the update
         """
-        current_time = time.monotonic() * 1000
-        last_time = self._last_update.get(name, 0)
+        now = time.monotonic_ns()
+        last_time = self._last_update.get(name)
+        interval = interval * 1_000_000_000
         
-        if current_time - last_time < interval:
+        if last_time is not None and now - last_time < interval:
             return
         
         self._pending.add(name)
         self._updates[name] = (callback, interval)
+        self._arm(now)
+    
+    def _arm(self, now):
+        """
+        Wake the main loop once the earliest pending update is due.
+        
+        Due updates are drained from an idle callback; otherwise a seconds
+        timer bridges the gap, rounded up so it never fires too early.
+        
+        Args:
+            now (int): Current monotonic time in nanoseconds
+        """
+        if self._batch_id or not self._pending:
+            return
         
-        if not self._batch_id:
-            self._batch_id = GLib.timeout_add(
-                interval // 10,  # Process updates at 1/10th the interval
+        next_due = min(
+            self._last_update[name] + self._updates[name][1]
+            if name in self._last_update else now
+            for name in self._pending
+        )
+        delay = next_due - now
+        
+        if delay <= 0:
+            self._batch_id = GLib.idle_add(
+                self._process_updates,
+                priority=GLib.PRIORITY_DEFAULT_IDLE
+            )
+        else:
+            self._batch_id = GLib.timeout_add_seconds(
+                -(-delay // 1_000_000_000),
                 self._process_updates
             )
     
     def _process_updates(self):
-        """Process all pending updates in the current batch."""
-        current_time = time.monotonic() * 1000
+        """Process all due updates, then re-arm for whatever is left."""
+        # One clock read serves every comparison in the batch
+        now = time.monotonic_ns()
         processed = set()
         
         for name in list(self._pending):
             if name in self._updates:
                 callback, interval = self._updates[name]
-                last_time = self._last_update.get(name, 0)
+                last_time = self._last_update.get(name)
                 
-                if current_time - last_time >= interval:
+                if last_time is None or now - last_time >= interval:
+                    # Failed updates are retried once their interval passes
+                    self._last_update[name] = now
                     try:
                         callback()
-                        self._last_update[name] = current_time
                         processed.add(name)
                     except Exception as e:
                         print(f"Update failed ({name}): {e}")
         
         self._pending -= processed
         self._batch_id = None
+        self._arm(now)
+        return False
+
+class Ticker:
+    """
+    Drives the shell's periodic work from a single one-second timer.
+    
+    Callbacks are registered with a period in whole seconds and are run
+    from the shared tick, so every poller wakes the main loop together
+    instead of each owning a timer. Like GLib sources, a callback that
+    returns False is removed.
+    
+    Attributes:
+        _callbacks (list): [callback, period] pairs in registration order
+        _phase (int): Number of ticks since the timer was armed
+        _source_id (int): GLib source ID of the tick, None while idle
+    """
+    
+    _instance = None
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+    
+    def _initialize(self):
+        """Set up an empty ticker; the timer starts with the first callback"""
+        self._callbacks = []
+        self._phase = 0
+        self._source_id = None
+    
+    def add(self, callback, period=1):
+        """
+        Run a callback every ``period`` seconds from the shared tick.
+        
+        Args:
+            callback (callable): Called without arguments; return False to stop
+            period (int): Seconds between calls
+        """
+        self._callbacks.append([callback, max(1, int(period))])
+        if self._source_id is None:
+            self._phase = 0
+            self._source_id = GLib.timeout_add_seconds(1, self._tick)
+    
+    def remove(self, callback):
+        """
+        Stop calling a callback.
+        
+        Args:
+            callback (callable): Callback previously passed to add()
+        """
+        self._callbacks = [entry for entry in self._callbacks if entry[0] != callback]
+    
+    def _tick(self):
+        """Run the callbacks whose period divides the current phase"""
+        self._phase += 1
+        for entry in list(self._callbacks):
+            callback, period = entry
+            if self._phase % period:
+                continue
+            try:
+                keep = callback()
+            except Exception as e:
+                print(f"Tick callback failed: {e}")
+                keep = True
+            if keep is False and entry in self._callbacks:
+                self._callbacks.remove(entry)
+        
+        if self._callbacks:
+            return True
+        self._source_id = None
         return False
@@ -7,40 +7,36 @@ by recycling GTK widgets instead of creating new ones.
 """
 
 from collections import deque
-from weakref import WeakKeyDictionary
 
 class WidgetPool:
     """
     Manages a pool of reusable GTK widgets.
     
-    Instead of creating and destroying widgets frequently, this class maintains
-    a pool of pre-created widgets that can be reused when needed.
+    Instead of creating and destroying widgets frequently, this class keeps
+    released widgets around so they can be reused when needed. Widgets are
+    only created on demand, and signal handlers attached through connect()
+    are disconnected when the widget is released.
     
     Attributes:
         _class (type): Widget class to pool
         _pool (collections.deque): Pool of available widgets
-        _active (WeakKeyDictionary): Currently active widgets
+        _active (dict): Handler IDs of currently active widgets, keyed by
+            id(widget)
     """
     
+    __slots__ = ('_class', '_pool', '_active')
+    
     def __init__(self, widget_class, size=20):
         """
         Initialize the widget pool.
         
         Args:
             widget_class (type): Class of widget to pool
-            size (int): Maximum size of the pool
+            size (int): Maximum number of released widgets kept for reuse
         """
         self._class = widget_class
         self._pool = deque(maxlen=size)
-        self._active = WeakKeyDictionary()
-        
-        # Pre-create widgets
-        for _ in range(size):
-            self._pool.append(self._create_widget())
-    
-    def _create_widget(self):
-        """Create a new widget instance."""
-        return self._class()
+        self._active = {}
     
     def acquire(self):
         """
@@ -49,21 +45,42 @@ class WidgetPool:
         Returns:
             A widget instance, either from the pool or newly created
         """
-        if self._pool:
-            widget = self._pool.pop()
-        else:
-            widget = self._create_widget()
-        self._active[widget] = True
+        widget = self._pool.pop() if self._pool else self._class()
+        self._active[id(widget)] = []
         return widget
     
+    def connect(self, widget, signal, handler, *args):
+        """
+        Connect a signal handler that is dropped when the widget is released.
+        
+        Args:
+            widget: Widget obtained from acquire()
+            signal (str): Signal name
+            handler (callable): Signal handler
+            *args: Extra arguments passed to the handler
+            
+        Returns:
+            int: The handler ID
+        """
+        handler_id = widget.connect(signal, handler, *args)
+        self._active.setdefault(id(widget), []).append(handler_id)
+        return handler_id
+    
     def release(self, widget):
         """
         Return a widget to the pool.
         
         Args:
             widget: Widget instance to return to the pool
+            
+        Returns:
+            bool: Whether the widget was kept for reuse
         """
-        if widget in self._active:
-            del self._active[widget]
+        handler_ids = self._active.pop(id(widget), None)
+        if handler_ids is not None:
+            for handler_id in handler_ids:
+                widget.disconnect(handler_id)
             if len(self._pool) < self._pool.maxlen:
                 self._pool.append(widget)
+                return True
+        return False
@@ -0,0 +1,422 @@
+# src/magi_shell/utils/x11.py
+"""
+X11 utilities for MAGI Shell.
+
+Provides a shared watcher for EWMH properties on the root window so widgets
+can react to PropertyNotify events instead of polling the window manager, and
+helpers that read and set window properties straight on the X server.
+"""
+
+from gi.repository import GLib
+from Xlib import X, Xatom, display as xdisplay, error as xerror
+from Xlib.protocol import event as xevent
+
+# _NET_WM_DESKTOP value that shows a window on every workspace
+ALL_DESKTOPS = 0xFFFFFFFF
+
+_display = None
+_atoms = {}
+
+def get_display():
+    """Return the shared Xlib connection, opening it on first use."""
+    global _display
+    if _display is None:
+        _display = xdisplay.Display()
+    return _display
+
+def get_atom(name):
+    """Return the interned atom for name, caching the lookup."""
+    atom = _atoms.get(name)
+    if atom is None:
+        atom = _atoms[name] = get_display().intern_atom(name)
+    return atom
+
+def get_window_name(window_id):
+    """
+    Read a window's title from the X server.
+
+    Args:
+        window_id (int): X window ID
+
+    Returns:
+        str: The _NET_WM_NAME title, falling back to WM_NAME, or None
+    """
+    window = get_display().create_resource_object('window', window_id)
+    try:
+        prop = window.get_full_property(get_atom('_NET_WM_NAME'), get_atom('UTF8_STRING'))
+        if prop:
+            return prop.value.decode(errors='replace')
+        return window.get_wm_name()
+    except xerror.XError:
+        return None
+
+def get_root_property(name):
+    """
+    Read a property of the root window in a single request.
+
+    Args:
+        name (str): Property name, e.g. ``_NET_CLIENT_LIST``
+
+    Returns:
+        The property's value array, or None if it is unset
+    """
+    root = get_display().screen().root
+    try:
+        prop = root.get_full_property(get_atom(name), X.AnyPropertyType)
+    except xerror.XError:
+        return None
+    return prop.value if prop else None
+
+def get_current_desktop():
+    """Return the index of the current workspace, or None if unknown."""
+    value = get_root_property('_NET_CURRENT_DESKTOP')
+    if value is None or not len(value):
+        return None
+    return int(value[0])
+
+def get_client_list():
+    """Return the IDs of the windows managed by the window manager."""
+    value = get_root_property('_NET_CLIENT_LIST')
+    return [] if value is None else [int(window_id) for window_id in value]
+
+def _send_client_message(window_id, message_type, data):
+    """
+    Send an EWMH client message about a window to the window manager.
+
+    The request is only queued; call flush() to send it.
+
+    Args:
+        window_id (int): Window the message is about (the root for
+            desktop-wide requests)
+        message_type (str): Message atom name, e.g. ``_NET_WM_STATE``
+        data (list): Up to five 32-bit values
+    """
+    root = get_display().screen().root
+    message = xevent.ClientMessage(
+        window=window_id,
+        client_type=get_atom(message_type),
+        data=(32, (list(data) + [0] * 5)[:5])
+    )
+    root.send_event(
+        message,
+        event_mask=X.SubstructureRedirectMask | X.SubstructureNotifyMask
+    )
+
+def flush():
+    """Send all queued requests to the X server."""
+    get_display().flush()
+
+def set_current_desktop(index):
+    """
+    Ask the window manager to switch workspaces.
+
+    Sends the EWMH ``_NET_CURRENT_DESKTOP`` client message to the root
+    window, which is what wmctrl -s does internally.
+
+    Args:
+        index (int): Workspace to switch to, counting from 0
+    """
+    root = get_display().screen().root
+    _send_client_message(root, '_NET_CURRENT_DESKTOP', [index, X.CurrentTime])
+    flush()
+
+def activate_window(window_id):
+    """
+    Ask the window manager to focus and raise a window.
+
+    Args:
+        window_id (int): X window ID
+    """
+    # Source indication 2: the request comes from a pager
+    _send_client_message(window_id, '_NET_ACTIVE_WINDOW', [2, X.CurrentTime])
+
+def add_window_states(window_id, *states):
+    """
+    Add up to two _NET_WM_STATE flags to a window, like wmctrl -b add.
+
+    Args:
+        window_id (int): X window ID
+        *states (str): State atom names, e.g. ``_NET_WM_STATE_STICKY``
+    """
+    if not 1 <= len(states) <= 2:
+        raise ValueError("_NET_WM_STATE changes one or two states at a time")
+    first, second = [get_atom(state) for state in states] + [0] * (2 - len(states))
+    # Action 1 is _NET_WM_STATE_ADD; source indication 2 is a pager
+    _send_client_message(window_id, '_NET_WM_STATE', [1, first, second, 2])
+
+def set_window_desktop(window_id, desktop):
+    """
+    Move a window to a workspace, like wmctrl -t.
+
+    Args:
+        window_id (int): X window ID
+        desktop (int): Workspace index, or ALL_DESKTOPS
+    """
+    _send_client_message(window_id, '_NET_WM_DESKTOP', [desktop, 2])
+
+def set_window_type(window_id, window_type):
+    """
+    Set a window's _NET_WM_WINDOW_TYPE.
+
+    Args:
+        window_id (int): X window ID
+        window_type (str): Type atom name, e.g. ``_NET_WM_WINDOW_TYPE_DOCK``
+    """
+    window = get_display().create_resource_object('window', window_id)
+    window.change_property(
+        get_atom('_NET_WM_WINDOW_TYPE'), Xatom.ATOM, 32, [get_atom(window_type)]
+    )
+
+def set_strut_partial(window_id, struts):
+    """
+    Reserve screen space for a window with _NET_WM_STRUT_PARTIAL.
+
+    Args:
+        window_id (int): X window ID
+        struts (list): The twelve CARDINAL strut values
+    """
+    window = get_display().create_resource_object('window', window_id)
+    window.change_property(
+        get_atom('_NET_WM_STRUT_PARTIAL'), Xatom.CARDINAL, 32, struts
+    )
+
+def move_window(window_id, x, y):
+    """
+    Move a window without changing its size.
+
+    Args:
+        window_id (int): X window ID
+        x (int): New left edge
+        y (int): New top edge
+    """
+    window = get_display().create_resource_object('window', window_id)
+    window.configure(x=x, y=y)
+
+def move_resize_window(window_id, x, y, width, height):
+    """
+    Move and resize a window with a single ConfigureWindow request.
+
+    Args:
+        window_id (int): X window ID
+        x (int): New left edge
+        y (int): New top edge
+        width (int): New width
+        height (int): New height
+    """
+    window = get_display().create_resource_object('window', window_id)
+    window.configure(x=x, y=y, width=width, height=height)
+
+class RootWindowWatcher:
+    """
+    Reports changes to root window properties from X PropertyNotify events.
+    
+    The watcher keeps its own X connection with PropertyChangeMask selected
+    on the root window, and on every client window so title changes are
+    seen too. The connection's socket is watched from the GLib main loop, so
+    callbacks run on the GTK thread and only when the window manager
+    actually updates a property.
+    
+    Attributes:
+        PROPERTIES (tuple): Root window properties being watched
+        TITLE_PROPERTIES (tuple): Window properties that hold a title
+        _subscribers (dict): Callbacks keyed by property name
+        _values (dict): Last value seen for each property
+        _display: Xlib connection receiving the events, None if unavailable
+        _names (dict): Property names keyed by atom
+        _source_id: GLib source ID of the socket watch
+        _title_atoms (set): Atoms of TITLE_PROPERTIES
+        _title_subscribers (list): Callbacks told which window was retitled
+        _titled_windows (set): Windows whose property changes are selected
+        _active_name (tuple): Focused window ID and its title, read once
+            per focus or title change
+    """
+    
+    PROPERTIES = ('_NET_CLIENT_LIST', '_NET_CURRENT_DESKTOP', '_NET_ACTIVE_WINDOW')
+    TITLE_PROPERTIES = ('_NET_WM_NAME', 'WM_NAME')
+    _instance = None
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+    
+    def _initialize(self):
+        """Open the event connection and hook its socket into the main loop"""
+        self._subscribers = {}
+        self._values = {}
+        self._display = None
+        self._names = {}
+        self._title_atoms = set()
+        self._title_subscribers = []
+        self._titled_windows = set()
+        self._source_id = None
+        self._active_name = (None, None)
+        
+        try:
+            self._display = xdisplay.Display()
+            self._names = {
+                self._display.intern_atom(name): name for name in self.PROPERTIES
+            }
+            self._title_atoms = {
+                self._display.intern_atom(name) for name in self.TITLE_PROPERTIES
+            }
+            root = self._display.screen().root
+            root.change_attributes(event_mask=X.PropertyChangeMask)
+            for name in self.PROPERTIES:
+                self._values[name] = self._read(name)
+            self._follow_titles()
+            self._display.flush()
+        except Exception as e:
+            print(f"Root window watcher unavailable: {e}")
+            self._display = None
+            return
+        
+        self._source_id = GLib.unix_fd_add_full(
+            GLib.PRIORITY_DEFAULT,
+            self._display.fileno(),
+            GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR,
+            self._on_events
+        )
+    
+    @property
+    def running(self):
+        """Whether property changes are being delivered."""
+        return self._display is not None
+    
+    def subscribe(self, name, callback):
+        """
+        Call ``callback(value)`` whenever a root window property changes.
+        
+        If the property's value is already known the callback is invoked
+        immediately with it.
+        
+        Args:
+            name (str): One of PROPERTIES
+            callback (callable): Receives the new value, or None if unset.
+                Desktops and windows are ints; the client list is a tuple
+                of window IDs.
+        """
+        self._subscribers.setdefault(name, []).append(callback)
+        if name in self._values:
+            callback(self._values[name])
+    
+    def subscribe_titles(self, callback):
+        """
+        Call ``callback(window_id)`` whenever a client window is retitled.
+        
+        Args:
+            callback (callable): Receives the X ID of the retitled window
+        """
+        self._title_subscribers.append(callback)
+    
+    def get(self, name):
+        """
+        Return the last known value of a watched property.
+        
+        Args:
+            name (str): One of PROPERTIES
+            
+        Returns:
+            The value as passed to subscribers, or None if unknown
+        """
+        return self._values.get(name)
+    
+    def get_active_window_name(self):
+        """
+        Return the focused window's title, shared by every caller.
+        
+        Returns:
+            str: The title, or None if no window has focus
+        """
+        window_id = self._values.get('_NET_ACTIVE_WINDOW')
+        if window_id is None:
+            return None
+        if self._active_name[0] != window_id:
+            self._active_name = (window_id, get_window_name(window_id))
+        return self._active_name[1]
+    
+    def _read(self, name):
+        """Read a watched property and convert it to its Python value"""
+        root = self._display.screen().root
+        prop = root.get_full_property(
+            self._display.intern_atom(name), X.AnyPropertyType
+        )
+        if prop is None or not len(prop.value):
+            return None
+        if name == '_NET_CLIENT_LIST':
+            return tuple(int(window_id) for window_id in prop.value)
+        value = int(prop.value[0])
+        # A zero _NET_ACTIVE_WINDOW means no window has focus
+        if name == '_NET_ACTIVE_WINDOW' and not value:
+            return None
+        return value
+    
+    def _follow_titles(self):
+        """Select PropertyChangeMask on the listed clients and the focused window"""
+        wanted = set(self._values.get('_NET_CLIENT_LIST') or ())
+        active = self._values.get('_NET_ACTIVE_WINDOW')
+        if active is not None:
+            wanted.add(active)
+        
+        # Windows that were destroyed meanwhile answer with BadWindow
+        catch = xerror.CatchError(xerror.BadWindow)
+        for window_id in self._titled_windows - wanted:
+            window = self._display.create_resource_object('window', window_id)
+            window.change_attributes(event_mask=X.NoEventMask, onerror=catch)
+        for window_id in wanted - self._titled_windows:
+            window = self._display.create_resource_object('window', window_id)
+            window.change_attributes(event_mask=X.PropertyChangeMask, onerror=catch)
+        self._titled_windows = wanted
+    
+    def _on_title_changed(self, window_id):
+        """Forget a stale focused title and tell subscribers about the change"""
+        if self._active_name[0] == window_id:
+            self._active_name = (None, None)
+        for callback in self._title_subscribers:
+            try:
+                callback(window_id)
+            except Exception as e:
+                print(f"Title callback failed: {e}")
+    
+    def _on_events(self, fd, condition):
+        """Dispatch queued PropertyNotify events to subscribers."""
+        try:
+            if condition & (GLib.IOCondition.HUP | GLib.IOCondition.ERR):
+                raise xerror.ConnectionClosedError('watcher')
+            root_id = self._display.screen().root.id
+            # Reading a property can queue further events; drain them all
+            while self._display.pending_events():
+                event = self._display.next_event()
+                if event.type != X.PropertyNotify:
+                    continue
+                if event.window.id != root_id:
+                    if event.atom in self._title_atoms:
+                        self._on_title_changed(event.window.id)
+                    continue
+                name = self._names.get(event.atom)
+                if name is not None:
+                    self._update(name, self._read(name))
+        except Exception as e:
+            print(f"Root window watcher stopped: {e}")
+            self._display = None
+            self._source_id = None
+            return False
+        return True
+    
+    def _update(self, name, value):
+        """Store a property's new value and notify its subscribers"""
+        if name in self._values and self._values[name] == value:
+            return
+        self._values[name] = value
+        if name == '_NET_ACTIVE_WINDOW':
+            # Re-read the title on every focus change, even to the same window
+            self._active_name = (None, None)
+        if name in ('_NET_CLIENT_LIST', '_NET_ACTIVE_WINDOW'):
+            self._follow_titles()
+            self._display.flush()
+        for callback in self._subscribers.get(name, ()):
+            try:
+                callback(value)
+            except Exception as e:
+                print(f"Root window callback failed ({name}): {e}")
@@ -6,12 +6,30 @@ Provides components for displaying system resource usage including
 CPU, RAM, GPU, and VRAM utilization.
 """
 
-from gi.repository import Gtk, GLib
-import psutil
-from pynvml import nvmlInit, nvmlDeviceGetHandleByIndex, nvmlDeviceGetMemoryInfo
-from pynvml import nvmlDeviceGetUtilizationRates
+from gi.repository import Gtk, Gdk, GLib, Gio
+from concurrent.futures import ThreadPoolExecutor
+import os
 from ..utils.cache import Cache
 
+# pynvml pulls in the NVIDIA driver library; it is imported by the first
+# sample on the sampler thread rather than while the panel starts
+pynvml = None
+
+# GPU figures are reused for this long (ms); with the 3 s refresh this means
+# NVML is queried on every other tick, about every 6 s
+NVML_SAMPLE_INTERVAL = 5000
+
+# Set by GTK 4.12+ while a toplevel cannot be seen at all; 0 on older GTK
+SUSPENDED = getattr(Gdk.ToplevelState, 'SUSPENDED', 0)
+
+# Seconds between samples, and how much slower to go in power-saver mode
+STATS_INTERVAL = 3
+POWER_SAVER_SLOWDOWN = 5
+
+# printf-style templates for the stats line, formatted in a single pass
+STATS_FORMAT = "CPU: %5.1f%% | RAM: %5.1f%%"
+GPU_STATS_FORMAT = STATS_FORMAT + " | GPU: %5.1f%% | VRAM: %5.1f%%"
+
 class SystemMonitor(Gtk.Box):
     """
     Widget displaying system resource utilization.
@@ -23,9 +41,22 @@ class SystemMonitor(Gtk.Box):
         _update_manager: UpdateManager instance for scheduling updates
         _prophecy_label: Label widget displaying the statistics
         _nvidia: NVIDIA GPU handle if available
-        _cpu_cache: Cache instance for CPU statistics
+        _gpu_ok: Whether NVML initialized and the GPU is still answering
+            queries; None until the first sample has probed for it
+        _cpu_cache: Cache instance holding recent CPU and RAM readings
+        _stat_fd (int): Open descriptor of /proc/stat
+        _meminfo_fd (int): Open descriptor of /proc/meminfo
+        _cpu_times (tuple): Busy and total jiffies at the previous sample
+        _gpu_cache: Cache instance holding the last NVML sample
+        _last_text: Text currently shown by the label
+        _pending: Whether a sample is being taken in the background
+        _power_monitor: Gio.PowerProfileMonitor, None if unsupported
+        _timer_id: Source ID of the sampling timer
     """
     
+    # NVML and /proc reads run here so the GTK thread never waits on them
+    _sampler = ThreadPoolExecutor(max_workers=1)
+    
     def __init__(self, update_manager):
         super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
         
@@ -39,42 +70,170 @@ class SystemMonitor(Gtk.Box):
     def _setup_monitoring(self):
         """Initialize system monitoring and NVIDIA GPU detection."""
         self._nvidia = None
-        try:
-            nvmlInit()
-            self._nvidia = nvmlDeviceGetHandleByIndex(0)
-        except Exception:
-            print("NVIDIA GPU not available")
+        self._gpu_ok = None
         
         self._cpu_cache = Cache(timeout=1000)
+        self._gpu_cache = Cache(timeout=NVML_SAMPLE_INTERVAL)
+        self._last_text = ''
+        self._pending = False
+        
+        # /proc files are re-read through descriptors kept open for good
+        self._stat_fd = os.open('/proc/stat', os.O_RDONLY)
+        self._meminfo_fd = os.open('/proc/meminfo', os.O_RDONLY)
+        self._cpu_times = self._read_cpu_times()
+        
+        self.connect('map', lambda *_: self._divine_resource_usage())
+        
+        # Sample less often while the system asks to save power
+        self._timer_id = None
+        try:
+            self._power_monitor = Gio.PowerProfileMonitor.dup_default()
+            self._power_monitor.connect(
+                'notify::power-saver-enabled', self._on_power_profile_changed
+            )
+        except AttributeError:
+            # GLib older than 2.70
+            self._power_monitor = None
+        self._schedule_sampling()
+    
+    def _schedule_sampling(self):
+        """(Re)start the sampling timer at the interval for the power profile."""
+        if self._timer_id is not None:
+            GLib.source_remove(self._timer_id)
+        
+        interval = STATS_INTERVAL
+        if self._power_monitor is not None and self._power_monitor.get_power_saver_enabled():
+            interval *= POWER_SAVER_SLOWDOWN
+        self._timer_id = GLib.timeout_add_seconds(interval, self._divine_resource_usage)
+    
+    def _on_power_profile_changed(self, monitor, pspec):
+        """Switch sampling rate and show fresh figures right away."""
+        self._schedule_sampling()
         self._divine_resource_usage()
-        GLib.timeout_add(3000, self._divine_resource_usage)
     
     def _divine_resource_usage(self):
-        """Update system resource usage statistics."""
+        """Start a background sample of system resource usage."""
+        # Nobody can see the figures, or the last sample is still running
+        if not self._is_visible() or self._pending:
+            return True
+        
+        self._pending = True
+        future = self._sampler.submit(self._read_stats)
+        future.add_done_callback(
+            lambda f: GLib.idle_add(self._show_stats, f)
+        )
+        return True
+    
+    def _is_visible(self):
+        """Whether the stats could be on screen right now."""
+        if not self.get_mapped():
+            return False
+        native = self.get_native()
+        surface = native.get_surface() if native else None
+        if SUSPENDED and isinstance(surface, Gdk.Toplevel):
+            return not surface.get_state() & SUSPENDED
+        return True
+    
+    def _read_stats(self):
+        """Read the usage figures and format them; runs on the sampler thread."""
+        cpu_load = self._read_cpu_load()
+        
+        # Reuse a RAM reading taken within the last second
+        ram_usage = self._cpu_cache.get('ram')
+        if ram_usage is None:
+            ram_usage = self._read_ram_usage()
+            self._cpu_cache.set('ram', ram_usage)
+        
+        if self._gpu_ok is None:
+            self._probe_gpu()
+        if self._gpu_ok:
+            gpu_load, vram_usage = self._sample_gpu()
+            
+            return GPU_STATS_FORMAT % (cpu_load, ram_usage, gpu_load, vram_usage)
+        return STATS_FORMAT % (cpu_load, ram_usage)
+    
+    def _read_cpu_times(self):
+        """Return (busy, total) jiffies from the aggregate cpu line of /proc/stat."""
+        line = os.pread(self._stat_fd, 256, 0).split(b'\n', 1)[0]
+        # user nice system idle iowait irq softirq steal; guest time is
+        # already included in user and nice
+        times = [int(value) for value in line.split()[1:9]]
+        total = sum(times)
+        return total - times[3] - times[4], total
+    
+    def _read_cpu_load(self):
+        """Return the CPU usage in percent since the previous call."""
+        busy, total = self._read_cpu_times()
+        last_busy, last_total = self._cpu_times
+        self._cpu_times = (busy, total)
+        if total <= last_total:
+            return 0.0
+        return 100.0 * max(busy - last_busy, 0) / (total - last_total)
+    
+    def _read_ram_usage(self):
+        """Return the share of memory in use, in percent, from /proc/meminfo."""
+        # MemTotal and MemAvailable are the first and third lines
+        meminfo = os.pread(self._meminfo_fd, 256, 0)
+        values = {}
+        for line in meminfo.split(b'\n'):
+            name, _, rest = line.partition(b':')
+            if name in (b'MemTotal', b'MemAvailable'):
+                values[name] = int(rest.split()[0])
+        total = values.get(b'MemTotal')
+        if not total:
+            return 0.0
+        return 100.0 * (total - values.get(b'MemAvailable', total)) / total
+    
+    def _probe_gpu(self):
+        """Load pynvml and open the first GPU; runs on the sampler thread."""
+        global pynvml
+        try:
+            import pynvml
+            from ..utils.nvml import get_gpu_handle
+        except ImportError:
+            print("NVIDIA GPU not available")
+            self._gpu_ok = False
+            return
+        
+        self._nvidia = get_gpu_handle()
+        self._gpu_ok = self._nvidia is not None
+    
+    def _show_stats(self, future):
+        """Put a finished sample on the label."""
+        self._pending = False
         try:
-            cpu_load = psutil.cpu_percent(interval=None)
-            memory_state = psutil.virtual_memory()
-            ram_usage = memory_state.percent
+            prophecy = future.result()
             
-            if self._nvidia:
-                try:
-                    gpu_prophecy = nvmlDeviceGetUtilizationRates(self._nvidia)
-                    gpu_memory = nvmlDeviceGetMemoryInfo(self._nvidia)
-                    gpu_load = gpu_prophecy.gpu
-                    vram_usage = (gpu_memory.used / gpu_memory.total) * 100
-                except:
-                    gpu_load = vram_usage = 0
-                
-                self._prophecy_label.set_label(
-                    f"CPU: {cpu_load:>5.1f}% | RAM: {ram_usage:>5.1f}% | "
-                    f"GPU: {gpu_load:>5.1f}% | VRAM: {vram_usage:>5.1f}%"
-                )
-            else:
-                self._prophecy_label.set_label(
-                    f"CPU: {cpu_load:>5.1f}% | RAM: {ram_usage:>5.1f}%"
-                )
+            # Skip the relayout when the rounded figures have not moved
+            if prophecy != self._last_text:
+                self._prophecy_label.set_label(prophecy)
+                self._last_text = prophecy
             
         except Exception as e:
             print(f"Resource monitoring error: {e}")
         
-        return True
+        return False
+    
+    def _sample_gpu(self):
+        """Return (gpu_load, vram_usage), querying NVML at most once per interval."""
+        sample = self._gpu_cache.get('gpu')
+        if sample is not None:
+            return sample
+        
+        try:
+            # The WSL2 NVML shim fails utilization queries unless a clock or
+            # power query comes first in the same cycle; harmless elsewhere
+            pynvml.nvmlDeviceGetClockInfo(self._nvidia, pynvml.NVML_CLOCK_SM)
+            gpu_prophecy = pynvml.nvmlDeviceGetUtilizationRates(self._nvidia)
+            gpu_memory = pynvml.nvmlDeviceGetMemoryInfo(self._nvidia)
+            sample = (gpu_prophecy.gpu, (gpu_memory.used / gpu_memory.total) * 100)
+        except pynvml.NVMLError as e:
+            # Stop probing a GPU that has gone away instead of
+            # paying for a failing NVML call on every tick
+            print(f"NVIDIA GPU stopped responding: {e}")
+            self._gpu_ok = False
+            return 0, 0
+        
+        self._gpu_cache.set('gpu', sample)
+        return sample
+
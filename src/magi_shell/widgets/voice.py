@@ -9,22 +9,96 @@ using system audio devices and the Whisper ASR service.
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, GLib
-import numpy as np
-import sounddevice as sd
-import threading
-import requests
-import subprocess
+from gi.repository import Gtk, GLib, Adw
+from concurrent.futures import ThreadPoolExecutor
+import signal
+import sys
 import time
 import os
+import shutil
+import struct
 from ..utils.config import load_config
+from ..utils.speech import speak
+from ..utils.process import spawn_async
+
+# Resolved once instead of searching PATH for every transcription
+XDOTOOL = shutil.which('xdotool') or 'xdotool'
+
+# Milliseconds between typed characters; xdotool's default of 12 makes a
+# long transcription take seconds to appear
+TYPE_DELAY_MS = 2
+
+# Where the voice assistant pipeline's output ends up
+ASR_LOG_PATH = '/tmp/MAGI/asr.log'
+ASSISTANT_LOG_PATH = '/tmp/MAGI/voice_assistant.log'
+
+# Audio is streamed to whisper in slices of this many bytes
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# (connect, read) timeouts in seconds for a transcription request
+WHISPER_TIMEOUT = (3, 30)
+
+# numpy and sounddevice are imported by the first recording, and requests
+# by the first upload, so the panel starts without loading them
+np = None
+sd = None
+
+# Keeps the connection to the whisper server alive between recordings
+_whisper_session = None
+
+# One long-lived worker sends recordings to whisper in order
+_transcriber = ThreadPoolExecutor(max_workers=1, thread_name_prefix='asr')
+
+# Seconds of audio the capture buffer holds before it has to grow
+RECORD_BUFFER_SECONDS = 60
+
+def _load_audio_modules():
+    """Import numpy and sounddevice the first time audio is recorded"""
+    global np, sd
+    if sd is None:
+        import numpy as np
+        import sounddevice as sd
+
+def _get_whisper_session():
+    """Return the shared whisper session, creating it on first use"""
+    global _whisper_session
+    if _whisper_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _whisper_session = requests.Session()
+        _whisper_session.mount(
+            'http://', HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=0)
+        )
+    return _whisper_session
+
+def _wav_header(data_size, sample_rate):
+    """Build the 44-byte RIFF header for mono 16-bit PCM audio"""
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b'data', data_size
+    )
+
+def _iter_upload_chunks(audio_data, sample_rate):
+    """Yield a WAV header followed by the int16 samples in fixed-size slices"""
+    raw = memoryview(audio_data).cast('B')
+    yield _wav_header(len(raw), sample_rate)
+    for offset in range(0, len(raw), UPLOAD_CHUNK_SIZE):
+        # urllib3 only sends bytes chunks as-is, so copy one slice at a time
+        yield bytes(raw[offset:offset + UPLOAD_CHUNK_SIZE])
 
 class WhisperingEarButton(Gtk.Button):
     """
-    Button that launches the voice assistant in a terminal window.
+    Button that runs the voice assistant pipeline in the background.
+    
+    Starts asr.py with its transcriptions piped straight into
+    voice_assistant.py for extended voice interaction sessions. Clicking
+    again while the pipeline runs stops it.
     
-    Provides a simple interface to start the voice assistant pipeline
-    in a separate terminal window for extended voice interaction sessions.
+    Attributes:
+        _ethereal_portal (tuple): The ASR and assistant Gio.Subprocess
+            objects while the pipeline runs, None otherwise
     """
     
     def __init__(self):
@@ -36,37 +110,59 @@ class WhisperingEarButton(Gtk.Button):
         self.connect('clicked', self._summon_listening_portal)
     
     def _summon_listening_portal(self, _):
-        """Launch the voice assistant in a terminal window."""
+        """Start the voice assistant pipeline, or stop it if it is running."""
         if self._ethereal_portal:
+            self._close_portal()
             return
-            
-        try:
-            sacred_scroll_path = os.path.dirname(os.path.abspath(__file__))
-            listening_spell = (
-                f"cd {sacred_scroll_path} && "
-                f"./asr.py | ./voice_assistant.py"
-            )
-            
-            self._ethereal_portal = subprocess.Popen(
-                ['mate-terminal', '--title=MAGI Voice Assistant', 
-                 '--command', f'bash -c "{listening_spell}"'],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-            
-            def portal_watcher():
-                if self._ethereal_portal:
-                    self._ethereal_portal.wait()
-                    self._ethereal_portal = None
-                return False
-            
-            GLib.timeout_add(1000, portal_watcher)
-            
-        except Exception as e:
-            print(f"Failed to open the listening portal: {e}")
-            if self._ethereal_portal:
-                self._ethereal_portal.terminate()
-                self._ethereal_portal = None
+        
+        sacred_scroll_path = os.path.normpath(
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../utils')
+        )
+        
+        # Connect the two scripts with a pipe of our own; no terminal
+        # or shell is needed in between. Each end is handed to its child.
+        read_fd, write_fd = os.pipe()
+        listening_ear = spawn_async(
+            [sys.executable, os.path.join(sacred_scroll_path, 'asr.py')],
+            cwd=sacred_scroll_path,
+            stdout_fd=write_fd,
+            log_path=ASR_LOG_PATH
+        )
+        if listening_ear is None:
+            os.close(read_fd)
+            return
+        speaking_voice = spawn_async(
+            [sys.executable, os.path.join(sacred_scroll_path, 'voice_assistant.py')],
+            on_exit=self._on_portal_closed,
+            cwd=sacred_scroll_path,
+            stdin_fd=read_fd,
+            log_path=ASSISTANT_LOG_PATH
+        )
+        if speaking_voice is None:
+            _stop_process(listening_ear)
+            return
+        
+        self._ethereal_portal = (listening_ear, speaking_voice)
+        self.add_css_class('listening')
+    
+    def _close_portal(self):
+        """Ask both pipeline processes to exit."""
+        for process in self._ethereal_portal or ():
+            _stop_process(process)
+    
+    def _on_portal_closed(self, process):
+        """Stop the ASR process and allow a new pipeline once the assistant exits."""
+        if self._ethereal_portal and self._ethereal_portal[1] is process:
+            listening_ear = self._ethereal_portal[0]
+            self._ethereal_portal = None
+            self.remove_css_class('listening')
+            _stop_process(listening_ear)
+
+def _stop_process(process):
+    """Send SIGTERM to a Gio.Subprocess that has not exited yet."""
+    # The identifier is cleared once the child has been reaped
+    if process.get_identifier() is not None:
+        process.send_signal(signal.SIGTERM)
 
 class VoiceInputButton(Gtk.Button):
     """
@@ -83,7 +179,8 @@ class VoiceInputButton(Gtk.Button):
         self._recording = False
         self._transcribing = False
         self._stream = None
-        self._audio_buffer = []
+        self._audio_buffer = None
+        self._audio_pos = 0
         self._start_time = 0
         
         self._setup_ui()
@@ -110,27 +207,26 @@ class VoiceInputButton(Gtk.Button):
         print("Starting recording...")
         self._recording = True
         self._start_time = time.monotonic()
-        self._audio_buffer.clear()
-        
-        if self._stream:
-            try:
-                self._stream.stop()
-                self._stream.close()
-            except:
-                pass
-            self._stream = None
+        self._close_stream()
         
         # Use system default audio input
         try:
+            _load_audio_modules()
             config = load_config()
             sample_rate = config.get('sample_rate', 16000)
             
-            self._stream = sd.InputStream(
+            # Reuse the capture buffer between recordings when it fits
+            capacity = sample_rate * RECORD_BUFFER_SECONDS
+            if self._audio_buffer is None or len(self._audio_buffer) < capacity:
+                self._audio_buffer = np.empty(capacity, dtype=np.int16)
+            self._audio_pos = 0
+            
+            self._stream = sd.RawInputStream(
                 channels=1,
                 callback=self._audio_callback,
-                blocksize=1024,
+                blocksize=0,  # Let PortAudio pick the most efficient size
                 samplerate=sample_rate,
-                dtype=np.float32
+                dtype='int16'
             )
             self._stream.start()
             self.set_child(self._record_icon)
@@ -139,6 +235,7 @@ class VoiceInputButton(Gtk.Button):
         except Exception as e:
             print(f"Recording error: {e}")
             self._recording = False
+            self._close_stream()
             self.set_child(self._mic_icon)
             dialog = Adw.MessageDialog.new(
                 self.get_root(),
@@ -148,10 +245,34 @@ class VoiceInputButton(Gtk.Button):
             dialog.add_response("ok", "OK")
             dialog.present()
     
+    def _close_stream(self):
+        """Stop and release the PortAudio stream if one is open"""
+        stream, self._stream = self._stream, None
+        if stream is None:
+            return
+        try:
+            try:
+                stream.stop()
+            finally:
+                stream.close()
+        except Exception as e:
+            print(f"Error stopping recording: {e}")
+    
     def _audio_callback(self, indata, *args):
         """Handle audio input"""
-        if self._recording:
-            self._audio_buffer.append(indata.copy())
+        if not self._recording:
+            return
+        
+        frames = np.frombuffer(indata, dtype=np.int16)
+        start = self._audio_pos
+        end = start + len(frames)
+        if end > len(self._audio_buffer):
+            # Long recording: double the buffer rather than drop audio
+            grown = np.empty(max(end, 2 * len(self._audio_buffer)), dtype=np.int16)
+            grown[:start] = self._audio_buffer[:start]
+            self._audio_buffer = grown
+        self._audio_buffer[start:end] = frames
+        self._audio_pos = end
     
     def _stop_recording(self, gesture, sequence):
         """Stop and process recording"""
@@ -163,13 +284,7 @@ class VoiceInputButton(Gtk.Button):
         duration = time.monotonic() - self._start_time
         
         # Stop recording
-        if self._stream:
-            try:
-                self._stream.stop()
-                self._stream.close()
-                self._stream = None
-            except Exception as e:
-                print(f"Error stopping recording: {e}")
+        self._close_stream()
         
         # Reset button state
         self.set_child(self._mic_icon)
@@ -180,27 +295,24 @@ class VoiceInputButton(Gtk.Button):
             print("Recording too short")
             if not hasattr(self, '_speaking'):
                 self._speaking = True
-                subprocess.run(['magi_espeak', "Press and hold to record audio"])
-                GLib.timeout_add(2000, self._reset_speaking_state)
+                speak("Press and hold to record audio")
+                GLib.timeout_add_seconds(2, self._reset_speaking_state)
             return
         
         # Process audio
-        if self._audio_buffer:
+        if self._audio_pos:
             try:
                 print("Processing audio...")
                 self._transcribing = True
                 self.set_sensitive(False)
                 
-                # Create a copy of audio data
-                audio_data = np.concatenate(self._audio_buffer.copy())
-                self._audio_buffer.clear()
+                # Hand over a copy of the recorded int16 samples so the
+                # capture buffer is kept for the next recording
+                audio_data = self._audio_buffer[:self._audio_pos].copy()
+                self._audio_pos = 0
                 
                 # Process in background
-                threading.Thread(
-                    target=self._transcribe_audio,
-                    args=(audio_data,),
-                    daemon=True
-                ).start()
+                _transcriber.submit(self._transcribe_audio, audio_data)
                 
             except Exception as e:
                 print(f"Audio processing error: {e}")
@@ -219,55 +331,30 @@ class VoiceInputButton(Gtk.Button):
         try:
             print("Sending to whisper...")
             endpoint = config.get('whisper_endpoint', 'http://localhost:5000/transcribe')
-            files = {'audio': ('audio.wav', audio_data.tobytes())}
-            response = requests.post(endpoint, files=files)
-            
-            GLib.idle_add(self._handle_transcription, response)
+            sample_rate = config.get('sample_rate', 16000)
+            response = _get_whisper_session().post(
+                endpoint,
+                data=_iter_upload_chunks(audio_data, sample_rate),
+                headers={'Content-Type': 'audio/wav'},
+                timeout=WHISPER_TIMEOUT
+            )
             
-        except Exception as e:
-            print(f"Transcription error: {e}")
-            GLib.idle_add(self._reset_state)
-    
-    def _handle_transcription(self, response):
-        """Handle transcription response"""
-        try:
+            # Decode the reply here so the GTK thread only gets the text
+            text = ''
             if response.ok:
                 text = response.json().get('transcription', '')
-                if text:
-                    subprocess.run(['xdotool', 'type', text], check=True)
-        except Exception as e:
-            print(f"Transcription handling error: {e}")
-        finally:
-            self._reset_state()
-        return False
-    
-    def _reset_state(self):
-        """Reset button state"""
-        self._transcribing = False
-        self.set_sensitive(True)
-        return False
-    
-    def _transcribe_audio(self, audio_data):
-        """Transcribe audio in background"""
-        config = load_config()
-        try:
-            print("Sending to whisper...")
-            files = {'audio': ('audio.wav', audio_data.tobytes())}
-            response = requests.post(config['whisper_endpoint'], files=files)
-            
-            GLib.idle_add(self._handle_transcription, response)
+            GLib.idle_add(self._handle_transcription, text)
             
         except Exception as e:
             print(f"Transcription error: {e}")
             GLib.idle_add(self._reset_state)
     
-    def _handle_transcription(self, response):
-        """Handle transcription response"""
+    def _handle_transcription(self, text):
+        """Type the transcribed text into the focused window"""
         try:
-            if response.ok:
-                text = response.json().get('transcription', '')
-                if text:
-                    subprocess.run(['xdotool', 'type', text], check=True)
+            if text:
+                # Typing takes a while for long text; don't hold up the UI
+                spawn_async([XDOTOOL, 'type', '--delay', TYPE_DELAY_MS, '--', text])
         except Exception as e:
             print(f"Transcription handling error: {e}")
         finally:
@@ -3,13 +3,19 @@
 Window management widgets for MAGI Shell.
 
 Provides components for managing and switching between windows
-using wmctrl and related window management tools.
+using EWMH window properties and client messages.
 """
 
-from gi.repository import Gtk, GLib
-import subprocess
-from ..utils.cache import Cache
+from gi.repository import Gtk
+from ..utils.update import Ticker
 from ..utils.widget_pool import WidgetPool
+from ..utils.x11 import (
+    RootWindowWatcher, get_client_list, get_window_name, activate_window, flush
+)
+
+def _is_shell_window(window_title):
+    """Whether a title belongs to one of the shell's own windows."""
+    return "MAGI" in window_title or "Desktop" in window_title
 
 class WindowList(Gtk.Box):
     """
@@ -23,7 +29,9 @@ class WindowList(Gtk.Box):
         _update_manager: UpdateManager instance for scheduling updates
         _button_pool: WidgetPool for window buttons
         _window_buttons: Dictionary mapping window IDs to their buttons
-        _cache: Cache instance for window state
+        _window_titles: Dictionary mapping window IDs to their shown titles
+        _hidden_windows: IDs of shell windows that get no button
+        _watcher: RootWindowWatcher reporting window manager changes
     """
     
     def __init__(self, update_manager):
@@ -33,58 +41,125 @@ class WindowList(Gtk.Box):
         self._update_manager = update_manager
         self._button_pool = WidgetPool(Gtk.Button)
         self._window_buttons = {}
-        self._cache = Cache()
+        self._window_titles = {}
+        self._hidden_windows = set()
+        self._watcher = RootWindowWatcher()
         
         self._update_window_list()
-        GLib.timeout_add(1000, self._update_window_list)
+        if self._watcher.running:
+            # Refresh only when windows open, close or are retitled
+            self._watcher.subscribe('_NET_CLIENT_LIST', self._on_windows_changed)
+            self._watcher.subscribe_titles(self._on_window_retitled)
+        else:
+            Ticker().add(self._update_window_list)
+            self.connect('destroy', lambda w: Ticker().remove(self._update_window_list))
+    
+    def _on_windows_changed(self, value):
+        """Handle a window list change reported by the WM."""
+        if value is not None:
+            self._update_window_list(value)
+    
+    def _on_window_retitled(self, window_id):
+        """Follow a listed window's new title, showing or hiding its button."""
+        if window_id not in (self._watcher.get('_NET_CLIENT_LIST') or ()):
+            return
+        window_title = get_window_name(window_id)
+        if window_title is None:
+            return
+        
+        if _is_shell_window(window_title):
+            self._hidden_windows.add(window_id)
+            if window_id in self._window_buttons:
+                self._remove_button(window_id)
+        else:
+            self._hidden_windows.discard(window_id)
+            if window_id in self._window_buttons:
+                self._set_title(window_id, window_title)
+            else:
+                self._add_button(window_id, window_title)
+    
+    def _set_title(self, window_id, window_title):
+        """Show a window's title on its button unless it is already shown."""
+        shown_title = window_title[:30]
+        if self._window_titles.get(window_id) != shown_title:
+            self._window_buttons[window_id].set_label(shown_title)
+            self._window_titles[window_id] = shown_title
     
-    def _update_window_list(self):
-        """Update the list of windows and their buttons."""
+    def _update_window_list(self, client_list=None):
+        """
+        Update the list of windows and their buttons.
+        
+        Args:
+            client_list: Window IDs already known from the watcher; read
+                from the root window when not given
+        """
         try:
-            window_census = subprocess.check_output(['wmctrl', '-l']).decode()
-            surviving_windows = set()
+            if client_list is None:
+                client_list = get_client_list()
+            surviving_windows = set(client_list)
+            new_windows = surviving_windows - self._window_buttons.keys() - self._hidden_windows
             
-            for window_scroll in window_census.splitlines():
-                window_parts = window_scroll.split(None, 3)
-                if len(window_parts) >= 4:
-                    window_id = window_parts[0]
-                    window_realm = int(window_parts[1])
-                    window_title = window_parts[3]
-                    
-                    if "MAGI" in window_title or "Desktop" in window_title:
-                        continue
-                        
-                    surviving_windows.add(window_id)
-                    if window_id not in self._window_buttons:
-                        window_button = self._button_pool.acquire()
-                        window_button.set_label(window_title[:30])
-                        window_button.connect('clicked', self.summon_window, window_id)
-                        self.append(window_button)
-                        self._window_buttons[window_id] = window_button
-                    else:
-                        self._window_buttons[window_id].set_label(window_title[:30])
+            # Only windows we have not seen before need their title read;
+            # walk the client list for them to keep the WM's order
+            for window_id in (client_list if new_windows else ()):
+                if window_id not in new_windows:
+                    continue
+                
+                window_title = get_window_name(window_id)
+                if window_title is None:
+                    continue
+                if _is_shell_window(window_title):
+                    self._hidden_windows.add(window_id)
+                    continue
+                self._add_button(window_id, window_title)
+            
+            self._hidden_windows &= surviving_windows
             
             # Remove buttons for closed windows
-            for departed_id in list(self._window_buttons.keys()):
-                if departed_id not in surviving_windows:
-                    departed_button = self._window_buttons.pop(departed_id)
-                    self.remove(departed_button)
-                    self._button_pool.release(departed_button)
+            for departed_id in self._window_buttons.keys() - surviving_windows:
+                self._remove_button(departed_id)
             
         except Exception as e:
             print(f"Window list update error: {e}")
         
         return True
     
+    def _add_button(self, window_id, window_title):
+        """Show a button for a window at the end of the list."""
+        window_button = self._button_pool.acquire()
+        self._button_pool.connect(window_button, 'clicked', self.summon_window, window_id)
+        if window_button.get_parent() is self:
+            # A pooled button is still in the box, just hidden
+            last_child = self.get_last_child()
+            if last_child is not window_button:
+                self.reorder_child_after(window_button, last_child)
+            window_button.set_visible(True)
+        else:
+            self.append(window_button)
+        self._window_buttons[window_id] = window_button
+        self._set_title(window_id, window_title)
+    
+    def _remove_button(self, window_id):
+        """Take a window's button out of the list."""
+        departed_button = self._window_buttons.pop(window_id)
+        self._window_titles.pop(window_id, None)
+        # Keep pooled buttons in the box so reusing them
+        # does not re-parent a widget
+        if self._button_pool.release(departed_button):
+            departed_button.set_visible(False)
+        else:
+            self.remove(departed_button)
+    
     def summon_window(self, button, window_id):
         """
         Activate and raise the specified window.
         
         Args:
             button: The button that was clicked
-            window_id: ID of the window to activate
+            window_id (int): X ID of the window to activate
         """
         try:
-            subprocess.run(['wmctrl', '-ia', window_id], check=True)
+            activate_window(window_id)
+            flush()
         except Exception as e:
             print(f"Window activation error: {e}")
@@ -3,14 +3,13 @@
 Workspace management widgets for MAGI Shell.
 
 Provides GUI components for managing and switching between virtual workspaces
-using wmctrl and xdotool.
+using EWMH root window properties and client messages.
 """
 
-from gi.repository import Gtk
-import subprocess
-from ..utils.cache import Cache
+from gi.repository import Gtk, GLib
+from ..utils.update import Ticker
 from ..utils.widget_pool import WidgetPool
-from ..utils.config import load_config
+from ..utils.x11 import RootWindowWatcher, get_current_desktop, set_current_desktop
 
 class WorkspaceSwitcher(Gtk.Box):
     """
@@ -20,21 +19,24 @@ class WorkspaceSwitcher(Gtk.Box):
     the currently active workspace.
     
     Attributes:
+        config: Shell configuration shared with the owning panel
         _update_manager: UpdateManager instance for scheduling updates
         _button_pool: WidgetPool for workspace buttons
         _active_buttons: Dictionary of active workspace buttons
-        _cache: Cache instance for workspace state
+        _shown_realm: Workspace whose button is currently highlighted
+        _watcher: RootWindowWatcher reporting workspace changes
     """
     
-    def __init__(self, update_manager):
+    def __init__(self, update_manager, config):
         print("Initializing WorkspaceSwitcher...")  # Debug print
         super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=1)
         
-        self.config = load_config()  # Load config in init
+        self.config = config
         self._update_manager = update_manager
         self._button_pool = WidgetPool(Gtk.Button)
         self._active_buttons = {}
-        self._cache = Cache()
+        self._shown_realm = None
+        self._watcher = RootWindowWatcher()
         
         self._setup_workspace_buttons()
         print("WorkspaceSwitcher initialization complete")  # Debug print
@@ -46,60 +48,70 @@ class WorkspaceSwitcher(Gtk.Box):
         for realm_number in range(self.config['workspace_count']):
             portal_button = self._button_pool.acquire()
             portal_button.set_label(str(realm_number + 1))
-            portal_button.connect('clicked', self._switch_workspace, realm_number)
+            self._button_pool.connect(portal_button, 'clicked', self._switch_workspace, realm_number)
             self.append(portal_button)
             self._active_buttons[realm_number] = portal_button
         
-        self._update_manager.schedule(
+        self._update_manager.schedule_seconds(
             'workspaces',
             self._update_current_workspace,
-            1000  # Update interval
+            1  # Update interval
         )
+        if self._watcher.running:
+            self._watcher.subscribe('_NET_CURRENT_DESKTOP', self._on_workspace_changed)
+        else:
+            Ticker().add(self._update_current_workspace)
+            self.connect('destroy', lambda w: Ticker().remove(self._update_current_workspace))
         print("Workspace buttons setup complete")  # Debug print
     
     def _switch_workspace(self, button, workspace_num):
         """Transport the user to another dimension"""
         try:
-            # Find current dimension
-            output = subprocess.check_output(['wmctrl', '-d']).decode()
-            current_realm = None
-            for line in output.splitlines():
-                if '*' in line:
-                    current_realm = int(line.split()[0])
-                    break
+            if self._shown_realm == workspace_num:
+                return
+            
+            # Engage the dimensional transport
+            set_current_desktop(workspace_num)
             
-            if current_realm != workspace_num:
-                # Engage the dimensional transport
-                subprocess.run(['wmctrl', '-s', str(workspace_num)], check=True)
-                subprocess.run(['xdotool', 'set_desktop', str(workspace_num)], check=True)
-                
-                # Ensure reality stabilizes
-                GLib.timeout_add(100, self._update_current_workspace)
+            # Without the watcher nobody reports the arrival, so look again
+            # once the main loop is idle; the fallback poll catches a slow WM
+            if not self._watcher.running:
+                GLib.idle_add(self._refresh_current_workspace)
         except Exception as dimensional_rift:
             print(f"Workspace transport malfunction: {dimensional_rift}")
     
     def _update_current_workspace(self):
         """Update our knowledge of the current dimension"""
+        self._refresh_current_workspace()
+        return True
+    
+    def _refresh_current_workspace(self):
+        """Read the current dimension from the root window and update the buttons"""
         try:
-            current_realm = self._cache.get('current_workspace')
-            if current_realm is not None:
-                return
-            
-            output = subprocess.check_output(['wmctrl', '-d']).decode()
-            for line in output.splitlines():
-                if '*' in line:
-                    workspace = int(line.split()[0])
-                    if workspace != current_realm:
-                        self._cache.set('current_workspace', workspace)
-                        self._update_buttons(workspace)
-                    break
+            if self._watcher.running:
+                workspace = self._watcher.get('_NET_CURRENT_DESKTOP')
+            else:
+                workspace = get_current_desktop()
+            if workspace is not None:
+                self._update_buttons(workspace)
         except Exception as reality_glitch:
             print(f"Workspace reality check failed: {reality_glitch}")
+        return False
+    
+    def _on_workspace_changed(self, value):
+        """Follow the window manager to another dimension"""
+        if value is not None:
+            self._update_buttons(value)
     
     def _update_buttons(self, current_realm):
-        """Update the appearance of dimensional portals"""
-        for realm_num, button in self._active_buttons.items():
-            if realm_num == current_realm:
-                button.add_css_class('active-workspace')
-            else:
-                button.remove_css_class('active-workspace')
+        """Move the highlight to the current portal, touching only the two that change"""
+        if current_realm == self._shown_realm:
+            return
+        
+        previous = self._active_buttons.get(self._shown_realm)
+        if previous is not None:
+            previous.remove_css_class('active-workspace')
+        current = self._active_buttons.get(current_realm)
+        if current is not None:
+            current.add_css_class('active-workspace')
+        self._shown_realm = current_realm
@@ -847,15 +847,20 @@ class MAGISettings(Adw.Application):
             
             # Variables for recording
             duration = 3  # seconds
-            recording_data = []
+            # The whole test fits in one buffer written in place by the callback
+            recording_data = np.zeros((duration * sample_rate, 1), dtype=np.float32)
+            recorded_frames = 0
             start_time = None
             is_recording = True
             
             def audio_callback(indata, frames, time, status):
+                nonlocal recorded_frames
                 if status:
                     print(status)
                 if is_recording:
-                    recording_data.append(indata.copy())
+                    count = min(frames, len(recording_data) - recorded_frames)
+                    recording_data[recorded_frames:recorded_frames + count] = indata[:count]
+                    recorded_frames += count
                     # Update level meter
                     level = 20 * np.log10(np.max(np.abs(indata)) + 1e-10)
                     GLib.idle_add(level_label.set_text, f"Level: {level:.1f} dB")
@@ -901,11 +906,10 @@ class MAGISettings(Adw.Application):
                 
                 # When recording is done, play it back
                 def on_recording_complete():
-                    if not recording_data:
+                    if not recorded_frames:
                         return
                     
-                    # Combine all recorded chunks
-                    recorded_audio = np.concatenate(recording_data)
+                    recorded_audio = recording_data[:recorded_frames]
                     
                     # Play the recording back
                     playback_dialog = Adw.MessageDialog.new(
@@ -1087,8 +1091,12 @@ class MAGISettings(Adw.Application):
         """Save current configuration to file"""
         try:
             os.makedirs(self.config_dir, exist_ok=True)
-            with open(self.config_file, 'w') as f:
+            # The shell re-reads this file whenever it changes, so replace
+            # it in one step rather than letting it see a partial write
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'w') as f:
                 json.dump(self.config, f, indent=4)
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
             print(f"Error saving config: {e}")
     
@@ -193,12 +193,8 @@ class VoiceProcessor:
             
         self.update_status("processing")
         
-        # Combine audio chunks
-        audio_data = np.concatenate([np.frombuffer(chunk, dtype=np.float32) 
-                                   for chunk in audio_chunks])
-        
-        # Calculate duration in seconds
-        duration = len(audio_data) / self.RATE
+        # Calculate duration in seconds (chunks hold raw float32 samples)
+        duration = sum(len(chunk) for chunk in audio_chunks) / 4 / self.RATE
         
         # Check if audio is too short
         if duration < self.MIN_AUDIO_DURATION:
@@ -207,7 +203,7 @@ class VoiceProcessor:
             return
         
         # Get transcription
-        transcription = self.transcribe_audio(audio_data)
+        transcription = self.transcribe_audio(audio_chunks)
         if transcription and not self.is_likely_hallucination(transcription):
             print(transcription, flush=True)
         else:
@@ -215,11 +211,16 @@ class VoiceProcessor:
         
         self.update_status("waiting")
 
-    def transcribe_audio(self, audio_data):
+    def transcribe_audio(self, audio_chunks):
+        """Send the captured float32 chunks to whisper as a chunked body"""
         try:
             endpoint = self.config.get('whisper_endpoint', 'http://localhost:5000/transcribe')
-            files = {'audio': ('audio.wav', audio_data.tobytes())}
-            response = requests.post(endpoint, files=files)
+            # Stream the chunks as they are rather than joining them first
+            response = requests.post(
+                endpoint,
+                data=iter(audio_chunks),
+                headers={'Content-Type': 'application/octet-stream'}
+            )
             
             if response.ok:
                 result = response.json()
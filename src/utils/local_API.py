@@ -3,7 +3,6 @@
 import os
 import json
 import subprocess
-import numpy as np
 from pathlib import Path
 from flask import Flask, request, render_template_string, jsonify, Response
 import requests
@@ -264,11 +263,11 @@ def transcribe():
         process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
         output, _ = process.communicate(audio_file.read())
         
-        audio_data = np.frombuffer(output, dtype=np.float32)
-        
+        # ffmpeg's f32le output is what whisper expects; send it as the body
         response = requests.post(
             'http://localhost:5000/transcribe',
-            files={'audio': ('audio.wav', audio_data.tobytes())}
+            data=output,
+            headers={'Content-Type': 'application/octet-stream'}
         )
         
         if response.ok:
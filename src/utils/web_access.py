@@ -8,7 +8,6 @@ import secrets
 import hashlib
 import threading
 import requests
-import numpy as np
 import subprocess
 import time
 from pathlib import Path
@@ -1008,14 +1007,12 @@ def transcribe():
             print(f"FFmpeg error: {error.decode()}")
             return jsonify({'error': 'Audio conversion failed'}), 500
         
-        # Convert to numpy array
-        audio_data = np.frombuffer(output, dtype=np.float32)
-        
-        # Send to Whisper
+        # Send ffmpeg's raw float32 samples to Whisper as the request body
         try:
             response = requests.post(
                 'http://localhost:5000/transcribe',
-                files={'audio': ('audio.wav', audio_data.tobytes())},
+                data=output,
+                headers={'Content-Type': 'application/octet-stream'},
                 timeout=30
             )
             
@@ -4,8 +4,10 @@ from flask import Flask, request, jsonify
 import numpy as np
 import torch
 from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline
+import io
 import os
 import sys
+import wave
 import warnings
 import logging
 
@@ -17,6 +19,15 @@ app = Flask(__name__)
 progress_file = '/tmp/MAGI/whisper_progress'
 SAMPLE_RATE = 16000  # Whisper expects 16kHz audio
 
+def decode_audio(audio_bytes):
+    """Return (float32 samples, sample rate) from a WAV or raw float32 body"""
+    if audio_bytes[:4] == b'RIFF':
+        with wave.open(io.BytesIO(audio_bytes)) as wav:
+            rate = wav.getframerate()
+            pcm = wav.readframes(wav.getnframes())
+        return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0, rate
+    return np.frombuffer(audio_bytes, dtype=np.float32), SAMPLE_RATE
+
 def update_progress(message, percentage):
     os.makedirs('/tmp/MAGI', exist_ok=True)
     with open(progress_file, 'w') as f:
@@ -64,12 +75,16 @@ except Exception as e:
 
 @app.route('/transcribe', methods=['POST'])
 def transcribe():
-    if 'audio' not in request.files:
+    # Accept either a multipart 'audio' file or a raw (possibly chunked) body
+    if 'audio' in request.files:
+        audio_bytes = request.files['audio'].read()
+    else:
+        audio_bytes = request.get_data()
+    if not audio_bytes:
         return jsonify({'error': 'No audio file provided'}), 400
     
     try:
-        audio_file = request.files['audio']
-        audio_data = np.frombuffer(audio_file.read(), dtype=np.float32)
+        audio_data, sample_rate = decode_audio(audio_bytes)
         
         # Handle both input formats
         if "input_features" in str(request.headers.get('Content-Type', '')):
@@ -79,7 +94,7 @@ def transcribe():
             # Raw audio input
             inputs = {
                 "raw": audio_data,
-                "sampling_rate": SAMPLE_RATE
+                "sampling_rate": sample_rate
             }
         
         # Process the audio